@@ -43,10 +43,7 @@ func (m *Manager) BuildBotCardDescription() string {
 	if os.Getenv("GITHUB_TOKEN") != "" || os.Getenv("GH_TOKEN") != "" {
 		ghState = "present"
 	}
-	ruleCount := 0
-	if m.Rules != nil {
-		ruleCount = len(m.Rules.Rules)
-	}
+	ruleList, schedules := m.rulesSnapshot()
 
 	lines := []string{
 		"| **Setting** | **Value** |",
@@ -61,14 +58,14 @@ func (m *Manager) BuildBotCardDescription() string {
 		fmt.Sprintf("| Timeout | %s |", m.Timeout),
 		fmt.Sprintf("| Max concurrent | %d |", m.MaxConcurrent),
 		"| Board access | kardbrd CLI/API |",
-		fmt.Sprintf("| Rules | %d |", ruleCount),
-		fmt.Sprintf("| Schedules | %d |", len(m.Schedules)),
+		fmt.Sprintf("| Rules | %d |", len(ruleList)),
+		fmt.Sprintf("| Schedules | %d |", len(schedules)),
 		fmt.Sprintf("| Last started | %s |", now.UTC().Format("2006-01-02 15:04 UTC")),
 	}
 
-	if m.Rules != nil && len(m.Rules.Rules) > 0 {
+	if len(ruleList) > 0 {
 		lines = append(lines, "", "## Triggers", "")
-		for _, rule := range m.Rules.Rules {
+		for _, rule := range ruleList {
 			lines = append(lines,
 				"### "+rule.Name,
 				"",
@@ -79,9 +76,9 @@ func (m *Manager) BuildBotCardDescription() string {
 		}
 	}
 
-	if len(m.Schedules) > 0 {
+	if len(schedules) > 0 {
 		lines = append(lines, "", "## Schedules", "")
-		for _, schedule := range m.Schedules {
+		for _, schedule := range schedules {
 			lines = append(lines,
 				"### "+schedule.Name,
 				"",
@@ -170,7 +167,7 @@ func (m *Manager) EnsureBotCard(ctx context.Context) error {
 	for _, list := range board.Lists {
 		for _, card := range list.Cards {
 			if card.Title == title {
-				m.BotCardID = card.ID
+				m.setBotCardID(card.ID)
 				_, err := m.Client.UpdateCard(ctx, card.ID, api.CardPatch{Description: &description})
 				return err
 			}
@@ -181,12 +178,18 @@ func (m *Manager) EnsureBotCard(ctx context.Context) error {
 	if err != nil {
 		return err
 	}
-	m.BotCardID = idFromRaw(raw)
+	m.setBotCardID(api.ResourceID(raw))
 	return nil
 }
 
+func (m *Manager) setBotCardID(cardID string) {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+	m.BotCardID = cardID
+}
+
 func (m *Manager) EnsureWizardCard(ctx context.Context) error {
-	if m.Rules != nil && len(m.Rules.Rules) > 0 {
+	if ruleList, _ := m.rulesSnapshot(); len(ruleList) > 0 {
 		return nil
 	}
 	board, err := m.loadBoard(ctx)
@@ -210,7 +213,7 @@ func (m *Manager) EnsureWizardCard(ctx context.Context) error {
 	if err != nil {
 		return err
 	}
-	cardID := idFromRaw(raw)
+	cardID := api.ResourceID(raw)
 	if cardID != "" {
 		_, _ = m.Client.AddComment(ctx, cardID, "Welcome. Mention @"+m.AgentName+" with the workflow you want to generate.")
 	}
@@ -237,34 +240,19 @@ func (m *Manager) RegisterSkills(ctx context.Context) error {
 	return err
 }
 
-func (m *Manager) loadBoard(ctx context.Context) (boardData, error) {
+func (m *Manager) loadBoard(ctx context.Context) (api.BoardLayout, error) {
 	raw, err := m.Client.GetBoard(ctx, m.BoardID, true)
 	if err != nil {
-		return boardData{}, err
+		return api.BoardLayout{}, err
 	}
-	var board boardData
+	var board api.BoardLayout
 	if err := json.Unmarshal(raw, &board); err != nil {
-		return boardData{}, err
+		return api.BoardLayout{}, err
 	}
 	return board, nil
 }
 
-type boardData struct {
-	Lists []boardList `json:"lists"`
-}
-
-type boardList struct {
-	ID    string      `json:"id"`
-	Name  string      `json:"name"`
-	Cards []boardCard `json:"cards"`
-}
-
-type boardCard struct {
-	ID    string `json:"id"`
-	Title string `json:"title"`
-}
-
-func chooseWizardList(lists []boardList) string {
+func chooseWizardList(lists []api.BoardList) string {
 	preferred := []string{"to do", "todo", "backlog", "inbox", "ideas"}
 	for _, target := range preferred {
 		for _, list := range lists {
@@ -307,14 +295,6 @@ func extractSkillInfo(path string, fallbackCommand string) SkillInfo {
 	return SkillInfo{Command: fallbackCommand, Name: fallbackCommand}
 }
 
-func idFromRaw(raw json.RawMessage) string {
-	var payload struct {
-		ID string `json:"id"`
-	}
-	_ = json.Unmarshal(raw, &payload)
-	return payload.ID
-}
-
 func truncate(value string, limit int) string {
 	if len(value) <= limit {
 		return value
@@ -99,17 +99,20 @@ func (m *Manager) HandleStopReaction(ctx context.Context, cardID string, comment
 }
 
 func (m *Manager) CheckRules(ctx context.Context, eventType string, message map[string]any) error {
-	if m.Rules == nil || len(m.Rules.Rules) == 0 || m.Paused {
+	m.mu.Lock()
+	engine, paused := m.Rules, m.Paused
+	m.mu.Unlock()
+	if engine == nil || len(engine.Rules) == 0 || paused {
 		return nil
 	}
-	if err := m.enrichRuleMessage(ctx, message); err != nil {
+	if err := m.enrichRuleMessage(ctx, engine, message); err != nil {
 		return err
 	}
 	cardID := stringField(message, "card_id")
 	if cardID == "" {
 		return nil
 	}
-	for _, rule := range m.Rules.Match(eventType, message) {
+	for _, rule := range engine.Match(eventType, message) {
 		if rule.IsStop() {
 			if err := m.HandleStopReaction(ctx, cardID, stringField(message, "comment_id")); err != nil {
 				return err
@@ -124,10 +127,11 @@ func (m *Manager) CheckRules(ctx context.Context, eventType string, message map[
 }
 
 func (m *Manager) ProcessRule(ctx context.Context, cardID string, rule rules.Rule, message map[string]any) error {
-	if err := m.acquire(ctx); err != nil {
+	release, err := m.acquire(ctx)
+	if err != nil {
 		return err
 	}
-	defer m.release()
+	defer release()
 
 	m.mu.Lock()
 	if _, exists := m.Active[cardID]; exists {
@@ -152,14 +156,11 @@ func (m *Manager) ProcessRule(ctx context.Context, cardID string, rule rules.Rul
 	}
 	execCtx, cancel := context.WithCancel(ctx)
 	defer cancel()
+	session := &ActiveSession{CardID: cardID, WorktreePath: worktreePath, Cancel: cancel}
 	m.mu.Lock()
-	m.Active[cardID] = &ActiveSession{CardID: cardID, WorktreePath: worktreePath, Cancel: cancel}
+	m.Active[cardID] = session
 	m.mu.Unlock()
-	defer func() {
-		m.mu.Lock()
-		delete(m.Active, cardID)
-		m.mu.Unlock()
-	}()
+	defer m.endSession(session)
 
 	cardMarkdown, err := m.Client.GetCardMarkdown(ctx, cardID)
 	if err != nil {
@@ -175,11 +176,13 @@ func (m *Manager) ProcessRule(ctx context.Context, cardID string, rule rules.Rul
 		CWD:            worktreePath,
 	})
 	result := m.Executor.Execute(execCtx, executor.Request{
-		Prompt:  promptText,
-		CWD:     worktreePath,
-		Model:   rule.ModelID(),
-		OnChunk: m.makeOnChunk(cardID),
+		Prompt:      promptText,
+		CWD:         worktreePath,
+		Model:       rule.ModelID(),
+		OnChunk:     m.makeOnChunk(session),
+		WantsChunks: m.hasStream(session),
 	})
+	release()
 	if execCtx.Err() != nil {
 		return nil
 	}
@@ -235,11 +238,11 @@ func (m *Manager) HandleStreamRequested(ctx context.Context, cardID string, stre
 	return nil
 }
 
-func (m *Manager) enrichRuleMessage(ctx context.Context, message map[string]any) error {
+func (m *Manager) enrichRuleMessage(ctx context.Context, engine *rules.Engine, message map[string]any) error {
 	needsLabels := false
 	needsAssignee := false
 	needsCommentAuthor := false
-	for _, rule := range m.Rules.Rules {
+	for _, rule := range engine.Rules {
 		if rule.RequireLabel != "" || rule.ExcludeLabel != "" {
 			needsLabels = true
 		}
@@ -324,6 +327,8 @@ func (m *Manager) isBotCard(message map[string]any) bool {
 		return true
 	}
 	cardID := stringField(message, "card_id")
+	m.mu.Lock()
+	defer m.mu.Unlock()
 	return cardID != "" && cardID == m.BotCardID
 }
 
@@ -334,10 +339,10 @@ func (m *Manager) HandleBotCardCommand(ctx context.Context, cardID string, conte
 	}
 	switch strings.ToLower(fields[0]) {
 	case "/pause":
-		m.Paused = true
+		m.setPaused(true)
 		_, _ = m.Client.AddComment(ctx, cardID, "⏸️ Paused - automation rules are now skipped. @mentions still work.\n\n@"+authorName)
 	case "/resume":
-		m.Paused = false
+		m.setPaused(false)
 		_, _ = m.Client.AddComment(ctx, cardID, "▶️ Resumed - automation rules are active again.\n\n@"+authorName)
 	case "/status":
 		_, _ = m.Client.AddComment(ctx, cardID, "🟢 **Online**\n\n@"+authorName)
@@ -358,6 +363,12 @@ func (m *Manager) HandleBotCardCommand(ctx context.Context, cardID string, conte
 	return nil
 }
 
+func (m *Manager) setPaused(paused bool) {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+	m.Paused = paused
+}
+
 func reloadMessage(loaded rules.Config, authorName string) string {
 	return "🔄 Reloaded " + strconv.Itoa(len(loaded.Rules)) + " rule(s) and " + strconv.Itoa(len(loaded.Schedules)) + " schedule(s) from kardbrd.yml\n\n@" + authorName
 }
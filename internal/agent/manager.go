@@ -135,19 +135,31 @@ func (m *Manager) Start(ctx context.Context) error {
 	if m.Executor == nil {
 		return errors.New("agent executor is not configured")
 	}
-	if _, err := m.Client.GetBoard(ctx, m.BoardID, false); err != nil {
+	// The board token check and the executor auth probe are independent, so
+	// wait on the slower of the two rather than their sum.
+	boardErr := make(chan error, 1)
+	go func() {
+		_, err := m.Client.GetBoard(ctx, m.BoardID, false)
+		boardErr <- err
+	}()
+	auth := m.Executor.CheckAuth(ctx)
+	if err := <-boardErr; err != nil {
 		return fmt.Errorf("validate board token: %w", err)
 	}
-	auth := m.Executor.CheckAuth(ctx)
 	if !auth.Authenticated {
 		if auth.Error == "" {
 			auth.Error = "executor is not authenticated"
 		}
 		return errors.New(auth.Error)
 	}
+	skillsDone := make(chan struct{})
+	go func() {
+		defer close(skillsDone)
+		_ = m.RegisterSkills(ctx)
+	}()
 	_ = m.EnsureWizardCard(ctx)
 	_ = m.EnsureBotCard(ctx)
-	_ = m.RegisterSkills(ctx)
+	<-skillsDone
 	if m.WebSocket != nil {
 		return m.WebSocket.Run(ctx)
 	}
@@ -183,10 +195,11 @@ func (m *Manager) ActiveCardIDs() []string {
 }
 
 func (m *Manager) ProcessMention(ctx context.Context, cardID, commentID, content, authorName string) error {
-	if err := m.acquire(ctx); err != nil {
+	release, err := m.acquire(ctx)
+	if err != nil {
 		return err
 	}
-	defer m.release()
+	defer release()
 
 	m.mu.Lock()
 	if _, exists := m.Active[cardID]; exists {
@@ -221,14 +234,11 @@ func (m *Manager) ProcessMention(ctx context.Context, cardID, commentID, content
 	execCtx, cancel := context.WithCancel(ctx)
 	defer cancel()
 
+	session := &ActiveSession{CardID: cardID, WorktreePath: worktreePath, CommentID: commentID, Cancel: cancel}
 	m.mu.Lock()
-	m.Active[cardID] = &ActiveSession{CardID: cardID, WorktreePath: worktreePath, CommentID: commentID, Cancel: cancel}
+	m.Active[cardID] = session
 	m.mu.Unlock()
-	defer func() {
-		m.mu.Lock()
-		delete(m.Active, cardID)
-		m.mu.Unlock()
-	}()
+	defer m.endSession(session)
 
 	cardMarkdown, err := m.Client.GetCardMarkdown(ctx, cardID)
 	if err != nil {
@@ -246,18 +256,20 @@ func (m *Manager) ProcessMention(ctx context.Context, cardID, commentID, content
 	})
 
 	result := m.Executor.Execute(execCtx, executor.Request{
-		Prompt:  promptText,
-		CWD:     worktreePath,
-		OnChunk: m.makeOnChunk(cardID),
+		Prompt:      promptText,
+		CWD:         worktreePath,
+		OnChunk:     m.makeOnChunk(session),
+		WantsChunks: m.hasStream(session),
 	})
+	// Post-processing is REST-bound; free the slot for the next session while
+	// the card stays in Active so duplicate mentions are still skipped.
+	release()
 	if execCtx.Err() != nil {
 		return nil
 	}
 
 	m.mu.Lock()
-	if session := m.Active[cardID]; session != nil {
-		session.SessionID = result.SessionID
-	}
+	session.SessionID = result.SessionID
 	m.mu.Unlock()
 
 	if result.Success {
@@ -278,17 +290,32 @@ func (m *Manager) ProcessMention(ctx context.Context, cardID, commentID, content
 	return nil
 }
 
-func (m *Manager) acquire(ctx context.Context) error {
+// acquire takes an admission slot and returns a release func that is safe to
+// call more than once.
+func (m *Manager) acquire(ctx context.Context) (func(), error) {
 	select {
 	case m.sem <- struct{}{}:
-		return nil
+		var once sync.Once
+		return func() { once.Do(func() { <-m.sem }) }, nil
 	case <-ctx.Done():
-		return ctx.Err()
+		return nil, ctx.Err()
 	}
 }
 
-func (m *Manager) release() {
-	<-m.sem
+// endSession removes the session from Active unless a newer session for the
+// same card has replaced it, and closes any stream it still holds.
+func (m *Manager) endSession(session *ActiveSession) {
+	m.mu.Lock()
+	if m.Active[session.CardID] == session {
+		delete(m.Active, session.CardID)
+	}
+	stream := session.Stream
+	session.Stream = nil
+	session.Streaming = false
+	m.mu.Unlock()
+	if stream != nil {
+		_ = stream.Close()
+	}
 }
 
 func (m *Manager) addReaction(ctx context.Context, cardID, commentID, emoji string) {
@@ -329,13 +356,13 @@ func (m *Manager) hasRecentBotComment(ctx context.Context, cardID string, window
 	if err := json.Unmarshal(raw, &card); err != nil {
 		return false
 	}
-	cutoff := time.Now().Add(-window)
+	cutoff := time.Now().Add(-window).UnixNano()
 	for _, comment := range card.Comments {
 		if !comment.Author.IsBot || comment.CreatedAt == "" {
 			continue
 		}
-		createdAt, err := time.Parse(time.RFC3339, strings.Replace(comment.CreatedAt, "Z", "+00:00", 1))
-		if err == nil && createdAt.After(cutoff) {
+		createdAt, err := time.Parse(time.RFC3339, comment.CreatedAt)
+		if err == nil && createdAt.UnixNano() > cutoff {
 			return true
 		}
 	}
@@ -352,11 +379,16 @@ End your comment by mentioning @%s.
 
 DO NOT do any new work - just publish what you already did.`, cardID, authorName)
 
+	release, err := m.acquire(ctx)
+	if err != nil {
+		return err
+	}
 	result := m.Executor.Execute(ctx, executor.Request{
 		Prompt:          resumePrompt,
 		ResumeSessionID: sessionID,
 		CWD:             worktreePath,
 	})
+	release()
 	if result.Success {
 		if result.ResultText != "" && !m.hasRecentBotComment(ctx, cardID, 60*time.Second) {
 			_, _ = m.Client.AddComment(ctx, cardID, result.ResultText+"\n\n@"+authorName)
@@ -386,9 +418,13 @@ func buildErrorComment(result executor.Result, label string) string {
 		details = append(details, fmt.Sprintf("**Duration:** %.1fs", float64(*result.DurationMS)/1000))
 	}
 	if result.Stderr != "" {
-		stderr := result.Stderr
+		stderr, dropped := result.Stderr, result.StderrDropped
 		if len(stderr) > 2000 {
-			stderr = stderr[:2000] + fmt.Sprintf("\n... (%d chars truncated)", len(result.Stderr)-2000)
+			dropped += len(stderr) - 2000
+			stderr = stderr[len(stderr)-2000:]
+		}
+		if dropped > 0 {
+			stderr = fmt.Sprintf("... (%d bytes truncated)\n", dropped) + stderr
 		}
 		details = append(details, "**stderr:**\n```\n"+stderr+"\n```")
 	}
@@ -401,30 +437,53 @@ func buildErrorComment(result executor.Result, label string) string {
 	return strings.Join(parts, "\n\n")
 }
 
-func (m *Manager) makeOnChunk(cardID string) func(content string, chunkType string) {
+func (m *Manager) makeOnChunk(session *ActiveSession) func(content string, chunkType string) {
 	sequence := 0
 	return func(content string, chunkType string) {
 		m.mu.Lock()
-		session := m.Active[cardID]
+		stream := session.Stream
 		m.mu.Unlock()
-		if session == nil || session.Stream == nil {
+		if stream == nil {
 			return
 		}
-		err := api.SendStreamChunk(context.Background(), session.Stream, cardID, content, chunkType, sequence)
+		err := api.SendStreamChunk(context.Background(), stream, session.CardID, content, chunkType, sequence)
 		if err != nil {
 			m.mu.Lock()
-			session.Stream = nil
-			session.Streaming = false
+			if session.Stream == stream {
+				session.Stream = nil
+				session.Streaming = false
+			}
 			m.mu.Unlock()
+			_ = stream.Close()
 			return
 		}
 		sequence++
 	}
 }
 
+func (m *Manager) hasStream(session *ActiveSession) func() bool {
+	return func() bool {
+		m.mu.Lock()
+		defer m.mu.Unlock()
+		return session.Stream != nil
+	}
+}
+
+// rulesSnapshot returns the current rules and schedules. ApplyRulesConfig
+// replaces both slices rather than mutating them, so the result is safe to
+// iterate without holding the lock.
+func (m *Manager) rulesSnapshot() ([]rules.Rule, []rules.Schedule) {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+	if m.Rules == nil {
+		return nil, m.Schedules
+	}
+	return m.Rules.Rules, m.Schedules
+}
+
 func (m *Manager) ApplyRulesConfig(cfg rules.Config) {
 	m.mu.Lock()
 	defer m.mu.Unlock()
-	m.Rules = &rules.Engine{Rules: append([]rules.Rule(nil), cfg.Rules...)}
+	m.Rules = rules.NewEngine(append([]rules.Rule(nil), cfg.Rules...))
 	m.Schedules = append([]rules.Schedule(nil), cfg.Schedules...)
 }
@@ -94,6 +94,27 @@ func TestHandleBoardEventProcessesMention(t *testing.T) {
 	assertEqual(t, 0, len(manager.Active))
 }
 
+func TestProcessMentionReleasesSlotBeforePostingResult(t *testing.T) {
+	manager := newTestManager(t)
+	client := manager.Client.(*fakeBoardClient)
+	slotsInUse := -1
+	activeDuringPost := false
+	client.onAddComment = func() {
+		slotsInUse = len(manager.sem)
+		manager.mu.Lock()
+		_, activeDuringPost = manager.Active["card1"]
+		manager.mu.Unlock()
+	}
+
+	if err := manager.ProcessMention(context.Background(), "card1", "comment1", "@coder do work", "Paul"); err != nil {
+		t.Fatal(err)
+	}
+
+	assertEqual(t, 0, slotsInUse)
+	assertEqual(t, true, activeDuringPost)
+	assertEqual(t, 0, len(manager.sem))
+}
+
 func TestHandleBoardEventSkipsDuplicateActiveCard(t *testing.T) {
 	manager := newTestManager(t)
 	manager.Active["card1"] = &ActiveSession{CardID: "card1", WorktreePath: "/tmp/card-card1"}
@@ -178,7 +199,7 @@ func TestStreamRequestedConnectsActiveSessionAndForwardsChunks(t *testing.T) {
 	assertEqual(t, "ws://stream.test/session", gotURL)
 	assertEqual(t, true, manager.Active["card1"].Streaming)
 
-	onChunk := manager.makeOnChunk("card1")
+	onChunk := manager.makeOnChunk(manager.Active["card1"])
 	onChunk("hello", "assistant")
 
 	assertEqual(t, 1, len(stream.payloads))
@@ -190,6 +211,42 @@ func TestStreamRequestedConnectsActiveSessionAndForwardsChunks(t *testing.T) {
 	assertEqual(t, 0, payload["sequence"].(int))
 }
 
+func TestProcessMentionClosesStreamWhenSessionEnds(t *testing.T) {
+	manager := newTestManager(t)
+	stream := &fakeStream{}
+	oldConnect := connectStream
+	connectStream = func(ctx context.Context, streamURL string) (api.StreamConn, error) {
+		return stream, nil
+	}
+	defer func() { connectStream = oldConnect }()
+	manager.Client.(*fakeBoardClient).onAddComment = func() {
+		_ = manager.HandleStreamRequested(context.Background(), "card1", "ws://stream.test/session")
+	}
+
+	if err := manager.ProcessMention(context.Background(), "card1", "comment1", "@coder do work", "Paul"); err != nil {
+		t.Fatal(err)
+	}
+
+	assertEqual(t, true, stream.closed)
+	assertEqual(t, 0, len(manager.Active))
+}
+
+func TestHasRecentBotCommentComparesTimestamps(t *testing.T) {
+	manager := newTestManager(t)
+	client := manager.Client.(*fakeBoardClient)
+	now := time.Now().UTC()
+	client.card = rawJSON(t, map[string]any{"comments": []any{
+		map[string]any{"created_at": now.Add(-5 * time.Minute).Format(time.RFC3339), "author": map[string]any{"is_bot": true}},
+		map[string]any{"created_at": now.Format(time.RFC3339Nano), "author": map[string]any{"is_bot": false}},
+	}})
+	assertEqual(t, false, manager.hasRecentBotComment(context.Background(), "card1", time.Minute))
+
+	client.card = rawJSON(t, map[string]any{"comments": []any{
+		map[string]any{"created_at": now.Add(-10 * time.Second).Format("2006-01-02T15:04:05.000000Z"), "author": map[string]any{"is_bot": true}},
+	}})
+	assertEqual(t, true, manager.hasRecentBotComment(context.Background(), "card1", time.Minute))
+}
+
 func newTestManager(t *testing.T) *Manager {
 	t.Helper()
 	client := &fakeBoardClient{
@@ -227,6 +284,7 @@ type fakeBoardClient struct {
 	createdListID      string
 	createdTitle       string
 	createdDescription string
+	onAddComment       func()
 }
 
 type commentCall struct {
@@ -254,6 +312,9 @@ func (c *fakeBoardClient) GetCardMarkdown(ctx context.Context, cardID string) (s
 }
 
 func (c *fakeBoardClient) AddComment(ctx context.Context, cardID, content string) (json.RawMessage, error) {
+	if c.onAddComment != nil {
+		c.onAddComment()
+	}
 	c.comments = append(c.comments, commentCall{cardID: cardID, content: content})
 	return mustRawJSON(map[string]any{"id": "comment-new"}), nil
 }
@@ -399,3 +460,12 @@ func assertContains(t *testing.T, got string, want string) {
 		t.Fatalf("expected %q to contain %q", got, want)
 	}
 }
+
+func TestBuildErrorCommentCountsAllDroppedStderr(t *testing.T) {
+	comment := buildErrorComment(executor.Result{Stderr: strings.Repeat("x", 2100), StderrDropped: 500}, "Failed")
+	assertContains(t, comment, "... (600 bytes truncated)\n"+strings.Repeat("x", 2000)+"\n```")
+
+	literal := "... (3 bytes truncated)\nreal output"
+	comment = buildErrorComment(executor.Result{Stderr: literal}, "Failed")
+	assertContains(t, comment, "```\n"+literal+"\n```")
+}
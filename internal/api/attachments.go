@@ -89,6 +89,9 @@ func (c *Client) GetAttachment(ctx context.Context, cardID, attachmentID string)
 func uploadToPresignedURL(ctx context.Context, uploadURL string, content []byte, contentType string) error {
 	var lastErr error
 	for attempt := 0; attempt < 3; attempt++ {
+		if attempt > 0 && waitRetry(ctx, attempt, lastErr) != nil {
+			return lastErr
+		}
 		req, err := http.NewRequestWithContext(ctx, "PUT", uploadURL, bytes.NewReader(content))
 		if err != nil {
 			return err
@@ -101,13 +104,17 @@ func uploadToPresignedURL(ctx context.Context, uploadURL string, content []byte,
 		}
 		_, _ = io.Copy(io.Discard, resp.Body)
 		_ = resp.Body.Close()
-		if resp.StatusCode < 500 {
-			if resp.StatusCode >= 400 {
-				return &APIError{Message: fmt.Sprintf("Upload failed with HTTP %d", resp.StatusCode), StatusCode: resp.StatusCode}
-			}
+		if resp.StatusCode < 400 {
 			return nil
 		}
-		lastErr = &APIError{Message: fmt.Sprintf("Upload failed with HTTP %d", resp.StatusCode), StatusCode: resp.StatusCode}
+		lastErr = &APIError{
+			Message:    fmt.Sprintf("Upload failed with HTTP %d", resp.StatusCode),
+			StatusCode: resp.StatusCode,
+			RetryAfter: retryAfter(resp.Header),
+		}
+		if !isRetryable(lastErr) {
+			return lastErr
+		}
 	}
 	return lastErr
 }
@@ -78,3 +78,21 @@ func TestUploadAttachmentPresignsPutsAndConfirms(t *testing.T) {
 	assertEqual(t, "text/plain; charset=utf-8", uploadedContentType)
 	assertEqual(t, "att1", result["id"])
 }
+
+func TestUploadRetriesRateLimitedPut(t *testing.T) {
+	attempts := 0
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		attempts++
+		if attempts == 1 {
+			w.WriteHeader(http.StatusTooManyRequests)
+			return
+		}
+		w.WriteHeader(http.StatusOK)
+	}))
+	defer server.Close()
+
+	if err := uploadToPresignedURL(context.Background(), server.URL, []byte("hi"), "text/plain"); err != nil {
+		t.Fatal(err)
+	}
+	assertEqual(t, 2, attempts)
+}
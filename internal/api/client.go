@@ -6,8 +6,10 @@ import (
 	"encoding/json"
 	"fmt"
 	"io"
+	"math/rand"
 	"net/http"
 	"net/url"
+	"strconv"
 	"strings"
 	"time"
 )
@@ -22,6 +24,9 @@ type APIError struct {
 	Message    string
 	Code       string
 	StatusCode int
+	// RetryAfter is the delay the server asked for in a Retry-After header,
+	// or zero when it sent none.
+	RetryAfter time.Duration
 }
 
 func (e *APIError) Error() string {
@@ -68,6 +73,33 @@ type BoardLabelCatalog struct {
 	Labels []Label `json:"labels"`
 }
 
+// BoardLayout is the subset of a board response needed to find lists and
+// cards by name.
+type BoardLayout struct {
+	Lists []BoardList `json:"lists"`
+}
+
+type BoardList struct {
+	ID    string      `json:"id"`
+	Name  string      `json:"name"`
+	Cards []BoardCard `json:"cards"`
+}
+
+type BoardCard struct {
+	ID    string `json:"id"`
+	Title string `json:"title"`
+}
+
+// ResourceID returns the "id" field of a created or updated resource, or ""
+// when the response has none.
+func ResourceID(raw json.RawMessage) string {
+	var payload struct {
+		ID string `json:"id"`
+	}
+	_ = json.Unmarshal(raw, &payload)
+	return payload.ID
+}
+
 type TodoPatch struct {
 	Title       *string
 	IsCompleted *bool
@@ -98,12 +130,25 @@ type ActivityOptions struct {
 	Board  string
 }
 
+// sharedTransport is used by every Client so concurrent agent sessions reuse
+// keep-alive connections to the API host. The default transport keeps only two
+// idle connections per host, which forces re-dials under concurrent load.
+var sharedTransport = newTransport()
+
+func newTransport() *http.Transport {
+	transport := http.DefaultTransport.(*http.Transport).Clone()
+	transport.MaxIdleConns = 100
+	transport.MaxIdleConnsPerHost = 32
+	return transport
+}
+
 func NewClient(baseURL, token string) *Client {
 	return &Client{
 		BaseURL: strings.TrimRight(baseURL, "/"),
 		Token:   token,
 		HTTPClient: &http.Client{
-			Timeout: 30 * time.Second,
+			Timeout:   30 * time.Second,
+			Transport: sharedTransport,
 		},
 	}
 }
@@ -131,6 +176,9 @@ func (c *Client) RequestRaw(ctx context.Context, method, path string, body any)
 
 	var lastErr error
 	for attempt := 0; attempt < 3; attempt++ {
+		if attempt > 0 && waitRetry(ctx, attempt, lastErr) != nil {
+			return nil, lastErr
+		}
 		raw, err := c.doJSON(ctx, method, path, rawBody)
 		if err == nil {
 			return raw, nil
@@ -146,6 +194,9 @@ func (c *Client) RequestRaw(ctx context.Context, method, path string, body any)
 func (c *Client) RequestMarkdown(ctx context.Context, path string) (string, error) {
 	var lastErr error
 	for attempt := 0; attempt < 3; attempt++ {
+		if attempt > 0 && waitRetry(ctx, attempt, lastErr) != nil {
+			return "", lastErr
+		}
 		text, err := c.doMarkdown(ctx, path)
 		if err == nil {
 			return text, nil
@@ -181,16 +232,20 @@ func (c *Client) doJSON(ctx context.Context, method, path string, body []byte) (
 		return nil, err
 	}
 	if resp.StatusCode >= 400 {
-		return nil, parseAPIError(resp.StatusCode, data)
+		return nil, parseAPIError(resp.StatusCode, resp.Header, data)
 	}
 	if len(data) == 0 {
 		return json.RawMessage(`null`), nil
 	}
 
-	var envelope map[string]json.RawMessage
-	if err := json.Unmarshal(data, &envelope); err == nil {
-		if unwrapped, ok := envelope["data"]; ok {
-			return unwrapped, nil
+	// Decode only the "data" member; a map would copy every top-level field of
+	// large board payloads just to find it.
+	if trimmed := bytes.TrimLeft(data, " \t\r\n"); len(trimmed) > 0 && trimmed[0] == '{' {
+		var envelope struct {
+			Data json.RawMessage `json:"data"`
+		}
+		if err := json.Unmarshal(data, &envelope); err == nil && envelope.Data != nil {
+			return envelope.Data, nil
 		}
 	}
 	return json.RawMessage(data), nil
@@ -215,17 +270,17 @@ func (c *Client) doMarkdown(ctx context.Context, path string) (string, error) {
 		return "", err
 	}
 	if resp.StatusCode >= 400 {
-		return "", parseAPIError(resp.StatusCode, data)
+		return "", parseAPIError(resp.StatusCode, resp.Header, data)
 	}
 	return string(data), nil
 }
 
-func parseAPIError(status int, data []byte) error {
+func parseAPIError(status int, header http.Header, data []byte) error {
 	message := strings.TrimSpace(string(data))
 	if strings.HasPrefix(message, "<") {
 		message = "API returned an HTML error response"
 	}
-	apiErr := &APIError{StatusCode: status, Message: message}
+	apiErr := &APIError{StatusCode: status, Message: message, RetryAfter: retryAfter(header)}
 	var payload struct {
 		Error string `json:"error"`
 		Code  string `json:"code"`
@@ -244,7 +299,53 @@ func parseAPIError(status int, data []byte) error {
 
 func isRetryable(err error) bool {
 	apiErr, ok := err.(*APIError)
-	return !ok || apiErr.StatusCode >= 500
+	return !ok || apiErr.StatusCode >= 500 || apiErr.StatusCode == http.StatusTooManyRequests
+}
+
+// retryBaseDelay is the pause before the first retry. It doubles for each
+// further retry, plus up to 50% jitter so clients don't retry in step.
+var retryBaseDelay = 200 * time.Millisecond
+
+// maxRetryAfter caps how long a server-sent Retry-After can hold a request.
+const maxRetryAfter = 30 * time.Second
+
+// waitRetry sleeps before retry number attempt (1-based), returning early
+// with an error if ctx is cancelled first. A Retry-After on lastErr replaces
+// the exponential backoff.
+func waitRetry(ctx context.Context, attempt int, lastErr error) error {
+	delay := retryBaseDelay << (attempt - 1)
+	if delay > 0 {
+		delay += time.Duration(rand.Int63n(int64(delay)/2 + 1))
+	}
+	if apiErr, ok := lastErr.(*APIError); ok && apiErr.RetryAfter > 0 {
+		delay = min(apiErr.RetryAfter, maxRetryAfter)
+	}
+	timer := time.NewTimer(delay)
+	defer timer.Stop()
+	select {
+	case <-ctx.Done():
+		return ctx.Err()
+	case <-timer.C:
+		return nil
+	}
+}
+
+// retryAfter parses a Retry-After header given in seconds or as an HTTP date.
+func retryAfter(header http.Header) time.Duration {
+	value := strings.TrimSpace(header.Get("Retry-After"))
+	if value == "" {
+		return 0
+	}
+	if seconds, err := strconv.Atoi(value); err == nil {
+		if seconds <= 0 {
+			return 0
+		}
+		return time.Duration(seconds) * time.Second
+	}
+	if at, err := http.ParseTime(value); err == nil {
+		return max(time.Until(at), 0)
+	}
+	return 0
 }
 
 func (c *Client) ListBoards(ctx context.Context) (json.RawMessage, error) {
@@ -9,6 +9,7 @@ import (
 	"reflect"
 	"strings"
 	"testing"
+	"time"
 )
 
 func TestCardLabelEndpointsEscapeIDs(t *testing.T) {
@@ -45,6 +46,47 @@ func TestCardLabelEndpointsEscapeIDs(t *testing.T) {
 	}
 }
 
+func TestClientsShareKeepAliveTransport(t *testing.T) {
+	first := NewClient("https://one.test", "tok")
+	second := NewClient("https://two.test", "tok")
+	if first.HTTPClient.Transport != second.HTTPClient.Transport {
+		t.Fatal("expected clients to share one transport")
+	}
+	assertEqual(t, 32, sharedTransport.MaxIdleConnsPerHost)
+}
+
+func TestRequestRawUnwrapsDataEnvelope(t *testing.T) {
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		switch r.URL.Path {
+		case "/wrapped/":
+			_, _ = w.Write([]byte(`{"data":{"id":"card1"},"meta":{"count":1}}`))
+		case "/null/":
+			_, _ = w.Write([]byte(`{"data":null}`))
+		default:
+			_, _ = w.Write([]byte(`[{"id":"board1"}]`))
+		}
+	}))
+	defer server.Close()
+
+	client := NewClient(server.URL, "tok")
+	for path, want := range map[string]string{
+		"/wrapped/": `{"id":"card1"}`,
+		"/null/":    `null`,
+		"/plain/":   `[{"id":"board1"}]`,
+	} {
+		raw, err := client.RequestRaw(context.Background(), http.MethodGet, path, nil)
+		if err != nil {
+			t.Fatal(err)
+		}
+		assertEqual(t, want, string(raw))
+	}
+}
+
+func TestResourceID(t *testing.T) {
+	assertEqual(t, "card1", ResourceID(json.RawMessage(`{"id":"card1","title":"x"}`)))
+	assertEqual(t, "", ResourceID(json.RawMessage(`[]`)))
+}
+
 func TestGetBoardLabelsExtractsCatalogFromBoardDetail(t *testing.T) {
 	requests := 0
 	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
@@ -201,6 +243,58 @@ func TestRequestRetriesServerErrors(t *testing.T) {
 	assertEqual(t, "yes", result["ok"])
 }
 
+func TestRequestRetriesRateLimitedRequests(t *testing.T) {
+	attempts := 0
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		attempts++
+		if attempts == 1 {
+			w.WriteHeader(http.StatusTooManyRequests)
+			_, _ = w.Write([]byte(`{"error":"slow down"}`))
+			return
+		}
+		writeJSON(t, w, map[string]any{"data": map[string]string{"ok": "yes"}})
+	}))
+	defer server.Close()
+
+	client := NewClient(server.URL, "tok")
+	if _, err := client.RequestRaw(context.Background(), "GET", "/api/boards/", nil); err != nil {
+		t.Fatal(err)
+	}
+	assertEqual(t, 2, attempts)
+}
+
+func TestRequestStopsRetryingWhenContextEnds(t *testing.T) {
+	attempts := 0
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		attempts++
+		w.WriteHeader(http.StatusBadGateway)
+	}))
+	defer server.Close()
+	ctx, cancel := context.WithTimeout(context.Background(), retryBaseDelay/2)
+	defer cancel()
+
+	client := NewClient(server.URL, "tok")
+	_, err := client.RequestRaw(ctx, "GET", "/api/boards/", nil)
+	var apiErr *APIError
+	if !errors.As(err, &apiErr) || apiErr.StatusCode != http.StatusBadGateway {
+		t.Fatalf("expected the 502 from the first attempt, got %v", err)
+	}
+	assertEqual(t, 1, attempts)
+}
+
+func TestRetryAfterParsesSecondsAndDates(t *testing.T) {
+	header := http.Header{}
+	assertEqual(t, time.Duration(0), retryAfter(header))
+	header.Set("Retry-After", "3")
+	assertEqual(t, 3*time.Second, retryAfter(header))
+	header.Set("Retry-After", time.Now().Add(-time.Minute).UTC().Format(http.TimeFormat))
+	assertEqual(t, time.Duration(0), retryAfter(header))
+	header.Set("Retry-After", time.Now().Add(time.Hour).UTC().Format(http.TimeFormat))
+	if got := retryAfter(header); got < 59*time.Minute {
+		t.Fatalf("expected about an hour, got %v", got)
+	}
+}
+
 func writeJSON(t *testing.T, w http.ResponseWriter, value any) {
 	t.Helper()
 	w.Header().Set("Content-Type", "application/json")
@@ -2,6 +2,7 @@ package cli
 
 import (
 	"context"
+	"crypto/sha256"
 	"encoding/json"
 	"fmt"
 	"os"
@@ -110,7 +111,7 @@ func newAgentStartCommand(root *rootOptions) *cobra.Command {
 			defer stop()
 			return runAgentRuntime(ctx, agentRuntime{
 				Config:           cfg,
-				Rules:            rules.Engine{Rules: rulesCfg.Rules},
+				Rules:            *rules.NewEngine(rulesCfg.Rules),
 				Schedules:        rulesCfg.Schedules,
 				WorktreesEnabled: worktreesEnabled,
 				GitRoot:          gitRoot,
@@ -217,7 +218,16 @@ func realRunAgentRuntime(ctx context.Context, runtime agentRuntime) error {
 
 	var wt agent.Worktree
 	if runtime.WorktreesEnabled {
-		wt = worktreeAdapter{worktree.NewManager(runtime.GitRoot, cfg.WorktreesDir, cfg.SetupCommand, cfg.Executor)}
+		worktrees := worktree.NewManager(runtime.GitRoot, cfg.WorktreesDir, cfg.SetupCommand, cfg.Executor)
+		if cfg.SetupCommand != "" {
+			worktrees.PoolSize = cfg.MaxConcurrent
+			go worktrees.RunPool(ctx, func(err error) {
+				fmt.Fprintf(os.Stderr, "warning: worktree pool: %s\n", err)
+			})
+		} else {
+			worktrees.PruneWarm()
+		}
+		wt = worktreeAdapter{worktrees}
 	}
 	ws := api.NewWebSocketClient(cfg.APIURL, cfg.Token)
 	var scheduleManager *scheduler.Manager
@@ -289,6 +299,7 @@ func realRunAgentRuntime(ctx context.Context, runtime agentRuntime) error {
 
 func rulesReloadLoop(ctx context.Context, path string, manager *agent.Manager) {
 	lastMod, _ := fileModTime(path)
+	lastSum, _ := fileDigest(path)
 	ticker := time.NewTicker(60 * time.Second)
 	defer ticker.Stop()
 	for {
@@ -300,6 +311,13 @@ func rulesReloadLoop(ctx context.Context, path string, manager *agent.Manager) {
 			if !ok || !modTime.After(lastMod) || manager.Reload == nil {
 				continue
 			}
+			// A touch or a save without edits bumps the mtime only; skip
+			// re-parsing and re-applying rules whose bytes did not change.
+			sum, ok := fileDigest(path)
+			if ok && sum == lastSum {
+				lastMod = modTime
+				continue
+			}
 			loaded, err := manager.Reload(ctx)
 			if err != nil {
 				continue
@@ -307,6 +325,7 @@ func rulesReloadLoop(ctx context.Context, path string, manager *agent.Manager) {
 			manager.ApplyRulesConfig(loaded)
 			_ = manager.EnsureBotCard(ctx)
 			lastMod = modTime
+			lastSum = sum
 		}
 	}
 }
@@ -319,6 +338,14 @@ func fileModTime(path string) (time.Time, bool) {
 	return info.ModTime(), true
 }
 
+func fileDigest(path string) ([sha256.Size]byte, bool) {
+	data, err := os.ReadFile(path)
+	if err != nil {
+		return [sha256.Size]byte{}, false
+	}
+	return sha256.Sum256(data), true
+}
+
 func newExecutor(cfg config.AgentConfig) (executor.Interface, error) {
 	execCfg := executor.Config{
 		CWD:     cfg.CWD,
@@ -21,7 +21,7 @@ func (e Claude) CheckAuth(ctx context.Context) AuthStatus {
 	}
 	stdout, stderr, code, err := runCommand(ctx, Config{Timeout: e.timeout()}, "", []string{"claude", "auth", "status"}, "", "claude auth status timed out", nil)
 	if err != nil || code == nil || *code != 0 {
-		return AuthStatus{Authenticated: false, Error: strings.TrimSpace(stderr + stdout)}
+		return AuthStatus{Authenticated: false, Error: strings.TrimSpace(stderr.text + stdout)}
 	}
 	var data struct {
 		LoggedIn         bool   `json:"loggedIn"`
@@ -46,8 +46,9 @@ func (e Claude) Execute(ctx context.Context, req Request) Result {
 	if req.ResumeSessionID != "" {
 		cmd = append(cmd, "--resume", req.ResumeSessionID)
 	}
-	stdout, stderr, code, err := runCommand(ctx, e.cfg, e.cwd(req), cmd, req.Prompt, "Claude execution timed out", func(line string) {
-		emitChunkLine(line, "claude", req.OnChunk)
+	parser := &claudeParser{}
+	_, stderr, code, err := runCommand(ctx, e.cfg, e.cwd(req), cmd, req.Prompt, "Claude execution timed out", func(line string) {
+		streamLine(line, parser, emitClaudeChunk, req.chunkSink())
 	})
-	return resultFromRun(parseClaudeOutput, stdout, stderr, code, cmd, err)
+	return resultFromRun(parser, stderr, code, cmd, err)
 }
@@ -34,8 +34,9 @@ func (e Codex) Execute(ctx context.Context, req Request) Result {
 	if req.Model != "" {
 		cmd = append(cmd, "--model", req.Model)
 	}
-	stdout, stderr, code, err := runCommand(ctx, e.cfg, e.cwd(req), cmd, req.Prompt, "Codex execution timed out", func(line string) {
-		emitChunkLine(line, "codex", req.OnChunk)
+	parser := &codexParser{}
+	_, stderr, code, err := runCommand(ctx, e.cfg, e.cwd(req), cmd, req.Prompt, "Codex execution timed out", func(line string) {
+		streamLine(line, parser, emitCodexChunk, req.chunkSink())
 	})
-	return resultFromRun(parseCodexOutput, stdout, stderr, code, cmd, err)
+	return resultFromRun(parser, stderr, code, cmd, err)
 }
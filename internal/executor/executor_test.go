@@ -126,6 +126,19 @@ printf '{"type":"AgentMessageChunk","content":"done"}\n'
 
 	result := <-done
 	assertEqual(t, true, result.Success)
+	assertEqual(t, "livedone", result.ResultText)
+}
+
+func TestRunCommandStreamsStdoutWithoutRetainingIt(t *testing.T) {
+	var lines []string
+	stdout, _, code, err := runCommand(context.Background(), Config{Timeout: testCommandTimeout}, "", []string{"sh", "-c", "printf 'a\\nb\\n'"}, "", "timed out", func(line string) {
+		lines = append(lines, line)
+	})
+	if err != nil || code == nil || *code != 0 {
+		t.Fatalf("unexpected run result: code=%v err=%v", code, err)
+	}
+	assertEqual(t, "", stdout)
+	assertEqual(t, "a,b", strings.Join(lines, ","))
 }
 
 func TestPiExecutorCommand(t *testing.T) {
@@ -148,6 +161,18 @@ printf '{"type":"session","id":"s1"}\n{"type":"message_end","message":"ok"}\n'
 	assertContains(t, args, "--session\nsession1")
 }
 
+func TestTailBufferKeepsLastBytes(t *testing.T) {
+	buf := tailBuffer{limit: 4}
+	for _, chunk := range []string{"abc", "defgh", "ij", "klmnop"} {
+		_, _ = buf.Write([]byte(chunk))
+	}
+	assertEqual(t, stderrTail{text: "mnop", dropped: 12}, buf.tail())
+
+	short := tailBuffer{limit: 4}
+	_, _ = short.Write([]byte("ok"))
+	assertEqual(t, stderrTail{text: "ok"}, short.tail())
+}
+
 func fakeBinary(t *testing.T, name string, script string) string {
 	t.Helper()
 	dir := t.TempDir()
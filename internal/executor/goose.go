@@ -36,8 +36,9 @@ func (e Goose) Execute(ctx context.Context, req Request) Result {
 	if req.ResumeSessionID != "" {
 		cmd = []string{"goose", "run", "-t", "-", "--output-format", "stream-json", "-r", "-n", req.ResumeSessionID}
 	}
-	stdout, stderr, code, err := runCommand(ctx, e.cfg, e.cwd(req), cmd, req.Prompt, "Goose execution timed out", func(line string) {
-		emitChunkLine(line, "goose", req.OnChunk)
+	parser := &gooseParser{}
+	_, stderr, code, err := runCommand(ctx, e.cfg, e.cwd(req), cmd, req.Prompt, "Goose execution timed out", func(line string) {
+		streamLine(line, parser, emitGooseChunk, req.chunkSink())
 	})
-	return resultFromRun(parseGooseOutput, stdout, stderr, code, cmd, err)
+	return resultFromRun(parser, stderr, code, cmd, err)
 }
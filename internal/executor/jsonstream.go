@@ -6,37 +6,7 @@ import (
 	"strings"
 )
 
-func emitChunks(stdout string, executorName string, onChunk func(content string, chunkType string)) {
-	if onChunk == nil {
-		return
-	}
-	for _, line := range strings.Split(strings.TrimSpace(stdout), "\n") {
-		if line == "" {
-			continue
-		}
-		emitChunkLine(line, executorName, onChunk)
-	}
-}
-
-func emitChunkLine(line string, executorName string, onChunk func(content string, chunkType string)) {
-	if onChunk == nil || line == "" {
-		return
-	}
-	var item map[string]any
-	if err := json.Unmarshal([]byte(line), &item); err != nil {
-		return
-	}
-	switch executorName {
-	case "claude":
-		emitClaudeChunk(item, onChunk)
-	case "codex":
-		emitCodexChunk(item, onChunk)
-	case "goose":
-		emitGooseChunk(item, onChunk)
-	case "pi":
-		emitPiChunk(item, onChunk)
-	}
-}
+type chunkEmitter func(item map[string]any, onChunk func(content string, chunkType string))
 
 func emitClaudeChunk(item map[string]any, onChunk func(content string, chunkType string)) {
 	switch item["type"] {
@@ -98,129 +68,168 @@ func mustJSON(value any) string {
 	return string(data)
 }
 
-func parseClaudeOutput(stdout string, stderr string, returnCode int, cmd []string) Result {
-	result := Result{Success: returnCode == 0, ReturnCode: &returnCode, Stderr: emptyToNone(stderr), Command: cmd}
-	for _, line := range strings.Split(strings.TrimSpace(stdout), "\n") {
-		if line == "" {
-			continue
-		}
-		var item map[string]any
-		if err := json.Unmarshal([]byte(line), &item); err != nil {
-			continue
-		}
-		switch item["type"] {
-		case "result":
-			result.ResultText, _ = item["result"].(string)
-			result.SessionID, _ = item["session_id"].(string)
-			if cost, ok := item["cost_usd"].(float64); ok {
-				result.CostUSD = &cost
-			}
-			if duration, ok := item["duration_ms"].(float64); ok {
-				value := int64(duration)
-				result.DurationMS = &value
-			}
-		case "error":
-			result.Success = false
-			if errObj, ok := item["error"].(map[string]any); ok {
-				result.Error, _ = errObj["message"].(string)
-			}
-		}
+// lineParser builds a Result from decoded output lines as they arrive, so
+// executors never need to keep their full stdout around.
+type lineParser interface {
+	wants(eventType string) bool
+	parseLine(item map[string]any)
+	finish(stderr string, returnCode int, cmd []string) Result
+}
+
+// streamLine decodes one stdout line once and hands it to both the result
+// parser and, when someone is watching, the chunk emitter. Only the event
+// type is decoded for lines neither of them needs.
+func streamLine(line string, parser lineParser, emit chunkEmitter, onChunk func(content string, chunkType string)) {
+	if line == "" {
+		return
 	}
-	if returnCode != 0 && result.Error == "" {
-		result.Success = false
-		result.Error = exitError("Claude", returnCode, stderr)
+	data := []byte(line)
+	var head struct {
+		Type string `json:"type"`
+	}
+	if err := json.Unmarshal(data, &head); err != nil {
+		return
+	}
+	if onChunk == nil && !parser.wants(head.Type) {
+		return
+	}
+	var item map[string]any
+	if err := json.Unmarshal(data, &item); err != nil {
+		return
+	}
+	parser.parseLine(item)
+	if onChunk != nil {
+		emit(item, onChunk)
 	}
-	return result
 }
 
-func parseCodexOutput(stdout string, stderr string, returnCode int, cmd []string) Result {
-	result := Result{Success: returnCode == 0, ReturnCode: &returnCode, Stderr: emptyToNone(stderr), Command: cmd}
-	var text strings.Builder
-	for _, line := range strings.Split(strings.TrimSpace(stdout), "\n") {
-		if line == "" {
-			continue
-		}
-		var item map[string]any
-		if err := json.Unmarshal([]byte(line), &item); err != nil {
-			continue
+type claudeParser struct {
+	result Result
+	failed bool
+}
+
+func (p *claudeParser) wants(eventType string) bool {
+	return eventType == "result" || eventType == "error"
+}
+
+func (p *claudeParser) parseLine(item map[string]any) {
+	switch item["type"] {
+	case "result":
+		p.result.ResultText, _ = item["result"].(string)
+		p.result.SessionID, _ = item["session_id"].(string)
+		if cost, ok := item["cost_usd"].(float64); ok {
+			p.result.CostUSD = &cost
 		}
-		eventType, _ := item["type"].(string)
-		if strings.Contains(eventType, "message") {
-			appendContent(&text, item["content"])
+		if duration, ok := item["duration_ms"].(float64); ok {
+			value := int64(duration)
+			p.result.DurationMS = &value
 		}
-		if eventType == "error" {
-			result.Success = false
-			result.Error = stringFromAny(item["message"])
-			if result.Error == "" {
-				result.Error = stringFromAny(item["error"])
-			}
+	case "error":
+		p.failed = true
+		if errObj, ok := item["error"].(map[string]any); ok {
+			p.result.Error, _ = errObj["message"].(string)
 		}
 	}
-	result.ResultText = strings.TrimSpace(text.String())
-	if returnCode != 0 && result.Error == "" {
-		result.Success = false
-		result.Error = exitError("Codex", returnCode, stderr)
-	}
-	return result
 }
 
-func parseGooseOutput(stdout string, stderr string, returnCode int, cmd []string) Result {
-	result := Result{Success: returnCode == 0, ReturnCode: &returnCode, Stderr: emptyToNone(stderr), Command: cmd}
-	var text strings.Builder
-	for _, line := range strings.Split(strings.TrimSpace(stdout), "\n") {
-		if line == "" {
-			continue
-		}
-		var item map[string]any
-		if err := json.Unmarshal([]byte(line), &item); err != nil {
-			continue
-		}
-		switch item["type"] {
-		case "AgentMessageChunk":
-			text.WriteString(stringFromAny(item["content"]))
-		case "error":
-			result.Success = false
-			result.Error = stringFromAny(item["message"])
+func (p *claudeParser) finish(stderr string, returnCode int, cmd []string) Result {
+	return finishResult(p.result, p.failed, "Claude", stderr, returnCode, cmd)
+}
+
+type codexParser struct {
+	text   strings.Builder
+	errMsg string
+	failed bool
+}
+
+func (p *codexParser) wants(eventType string) bool {
+	return strings.Contains(eventType, "message") || eventType == "error"
+}
+
+func (p *codexParser) parseLine(item map[string]any) {
+	eventType, _ := item["type"].(string)
+	if strings.Contains(eventType, "message") {
+		appendContent(&p.text, item["content"])
+	}
+	if eventType == "error" {
+		p.failed = true
+		p.errMsg = stringFromAny(item["message"])
+		if p.errMsg == "" {
+			p.errMsg = stringFromAny(item["error"])
 		}
 	}
-	result.ResultText = strings.TrimSpace(text.String())
-	if returnCode != 0 && result.Error == "" {
-		result.Success = false
-		result.Error = exitError("Goose", returnCode, stderr)
+}
+
+func (p *codexParser) finish(stderr string, returnCode int, cmd []string) Result {
+	result := Result{ResultText: strings.TrimSpace(p.text.String()), Error: p.errMsg}
+	return finishResult(result, p.failed, "Codex", stderr, returnCode, cmd)
+}
+
+type gooseParser struct {
+	text   strings.Builder
+	errMsg string
+	failed bool
+}
+
+func (p *gooseParser) wants(eventType string) bool {
+	return eventType == "AgentMessageChunk" || eventType == "error"
+}
+
+func (p *gooseParser) parseLine(item map[string]any) {
+	switch item["type"] {
+	case "AgentMessageChunk":
+		p.text.WriteString(stringFromAny(item["content"]))
+	case "error":
+		p.failed = true
+		p.errMsg = stringFromAny(item["message"])
 	}
-	return result
 }
 
-func parsePiOutput(stdout string, stderr string, returnCode int, cmd []string) Result {
-	result := Result{Success: returnCode == 0, ReturnCode: &returnCode, Stderr: emptyToNone(stderr), Command: cmd}
-	var text strings.Builder
-	for _, line := range strings.Split(strings.TrimSpace(stdout), "\n") {
-		if line == "" {
-			continue
-		}
-		var item map[string]any
-		if err := json.Unmarshal([]byte(line), &item); err != nil {
-			continue
-		}
-		switch item["type"] {
-		case "session":
-			result.SessionID = stringFromAny(item["id"])
-		case "message_end":
-			switch msg := item["message"].(type) {
-			case string:
-				text.WriteString(msg)
-			case map[string]any:
-				appendContent(&text, msg["content"])
-			}
-		case "error":
-			result.Success = false
-			result.Error = stringFromAny(item["message"])
+func (p *gooseParser) finish(stderr string, returnCode int, cmd []string) Result {
+	result := Result{ResultText: strings.TrimSpace(p.text.String()), Error: p.errMsg}
+	return finishResult(result, p.failed, "Goose", stderr, returnCode, cmd)
+}
+
+type piParser struct {
+	text      strings.Builder
+	sessionID string
+	errMsg    string
+	failed    bool
+}
+
+func (p *piParser) wants(eventType string) bool {
+	return eventType == "session" || eventType == "message_end" || eventType == "error"
+}
+
+func (p *piParser) parseLine(item map[string]any) {
+	switch item["type"] {
+	case "session":
+		p.sessionID = stringFromAny(item["id"])
+	case "message_end":
+		switch msg := item["message"].(type) {
+		case string:
+			p.text.WriteString(msg)
+		case map[string]any:
+			appendContent(&p.text, msg["content"])
 		}
+	case "error":
+		p.failed = true
+		p.errMsg = stringFromAny(item["message"])
 	}
-	result.ResultText = strings.TrimSpace(text.String())
+}
+
+func (p *piParser) finish(stderr string, returnCode int, cmd []string) Result {
+	result := Result{ResultText: strings.TrimSpace(p.text.String()), SessionID: p.sessionID, Error: p.errMsg}
+	return finishResult(result, p.failed, "Pi", stderr, returnCode, cmd)
+}
+
+func finishResult(result Result, failed bool, name string, stderr string, returnCode int, cmd []string) Result {
+	result.Success = returnCode == 0 && !failed
+	result.ReturnCode = &returnCode
+	result.Stderr = emptyToNone(stderr)
+	result.Command = cmd
 	if returnCode != 0 && result.Error == "" {
-		result.Success = false
-		result.Error = exitError("Pi", returnCode, stderr)
+		result.Error = exitError(name, returnCode, stderr)
 	}
 	return result
 }
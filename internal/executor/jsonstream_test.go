@@ -1,9 +1,12 @@
 package executor
 
-import "testing"
+import (
+	"strings"
+	"testing"
+)
 
 func TestParseClaudeOutput(t *testing.T) {
-	result := parseClaudeOutput(`{"type":"result","result":"done","session_id":"s1","cost_usd":1.25,"duration_ms":42}`+"\n", "", 0, []string{"claude"})
+	result := streamOutput(&claudeParser{}, `{"type":"result","result":"done","session_id":"s1","cost_usd":1.25,"duration_ms":42}`+"\n", emitClaudeChunk, nil)
 	assertEqual(t, true, result.Success)
 	assertEqual(t, "done", result.ResultText)
 	assertEqual(t, "s1", result.SessionID)
@@ -18,13 +21,13 @@ func TestParseClaudeOutput(t *testing.T) {
 func TestParseCodexOutputAggregatesMessages(t *testing.T) {
 	stdout := `{"type":"item.message","content":[{"type":"text","text":"hello "}]}` + "\n" +
 		`{"type":"response.message","content":"world"}` + "\n"
-	result := parseCodexOutput(stdout, "", 0, []string{"codex"})
+	result := streamOutput(&codexParser{}, stdout, emitCodexChunk, nil)
 	assertEqual(t, true, result.Success)
 	assertEqual(t, "hello world", result.ResultText)
 }
 
 func TestParseGooseOutputAggregatesChunks(t *testing.T) {
-	result := parseGooseOutput(`{"type":"AgentMessageChunk","content":"hello"}`+"\n", "", 0, []string{"goose"})
+	result := streamOutput(&gooseParser{}, `{"type":"AgentMessageChunk","content":"hello"}`+"\n", emitGooseChunk, nil)
 	assertEqual(t, true, result.Success)
 	assertEqual(t, "hello", result.ResultText)
 }
@@ -32,7 +35,7 @@ func TestParseGooseOutputAggregatesChunks(t *testing.T) {
 func TestParsePiOutputTracksSession(t *testing.T) {
 	stdout := `{"type":"session","id":"s1"}` + "\n" +
 		`{"type":"message_end","message":{"content":"done"}}` + "\n"
-	result := parsePiOutput(stdout, "", 0, []string{"pi"})
+	result := streamOutput(&piParser{}, stdout, emitPiChunk, nil)
 	assertEqual(t, true, result.Success)
 	assertEqual(t, "s1", result.SessionID)
 	assertEqual(t, "done", result.ResultText)
@@ -44,8 +47,8 @@ func TestEmitChunksForAssistantAndToolEvents(t *testing.T) {
 		chunks = append(chunks, chunkType+":"+content)
 	}
 
-	emitChunks(`{"type":"assistant","content":"hello"}`+"\n"+`{"type":"tool_use","tool":"Read"}`+"\n", "claude", onChunk)
-	emitChunks(`{"type":"AgentMessageChunk","content":"goose"}`+"\n"+`{"type":"ToolCallUpdate","tool":"shell"}`+"\n", "goose", onChunk)
+	streamOutput(&claudeParser{}, `{"type":"assistant","content":"hello"}`+"\n"+`{"type":"tool_use","tool":"Read"}`+"\n", emitClaudeChunk, onChunk)
+	streamOutput(&gooseParser{}, `{"type":"AgentMessageChunk","content":"goose"}`+"\n"+`{"type":"ToolCallUpdate","tool":"shell"}`+"\n", emitGooseChunk, onChunk)
 
 	assertEqual(t, "assistant:hello", chunks[0])
 	assertEqual(t, "tool_use:", chunks[1][:9])
@@ -53,6 +56,29 @@ func TestEmitChunksForAssistantAndToolEvents(t *testing.T) {
 	assertEqual(t, "tool_use:", chunks[3][:9])
 }
 
+func TestChunkSinkSkipsDecodingWithoutConsumer(t *testing.T) {
+	calls := 0
+	streaming := false
+	req := Request{
+		OnChunk:     func(content string, chunkType string) { calls++ },
+		WantsChunks: func() bool { return streaming },
+	}
+
+	streamLine(`{"type":"assistant","content":"hidden"}`, &claudeParser{}, emitClaudeChunk, req.chunkSink())
+	streaming = true
+	streamLine(`{"type":"assistant","content":"shown"}`, &claudeParser{}, emitClaudeChunk, req.chunkSink())
+
+	assertEqual(t, 1, calls)
+}
+
+// streamOutput feeds stdout to parser line by line the way runCommand does.
+func streamOutput(parser lineParser, stdout string, emit chunkEmitter, onChunk func(content string, chunkType string)) Result {
+	for _, line := range strings.Split(strings.TrimSpace(stdout), "\n") {
+		streamLine(line, parser, emit, onChunk)
+	}
+	return parser.finish("", 0, nil)
+}
+
 func assertEqual[T comparable](t *testing.T, want T, got T) {
 	t.Helper()
 	if got != want {
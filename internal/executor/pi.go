@@ -36,8 +36,9 @@ func (e Pi) Execute(ctx context.Context, req Request) Result {
 	if req.ResumeSessionID != "" {
 		cmd = []string{"pi", "--mode", "json", "-p", "-", "-a", "--session", req.ResumeSessionID}
 	}
-	stdout, stderr, code, err := runCommand(ctx, e.cfg, e.cwd(req), cmd, req.Prompt, "Pi execution timed out", func(line string) {
-		emitChunkLine(line, "pi", req.OnChunk)
+	parser := &piParser{}
+	_, stderr, code, err := runCommand(ctx, e.cfg, e.cwd(req), cmd, req.Prompt, "Pi execution timed out", func(line string) {
+		streamLine(line, parser, emitPiChunk, req.chunkSink())
 	})
-	return resultFromRun(parsePiOutput, stdout, stderr, code, cmd, err)
+	return resultFromRun(parser, stderr, code, cmd, err)
 }
@@ -12,7 +12,9 @@ import (
 	"time"
 )
 
-func runCommand(ctx context.Context, cfg Config, cwd string, args []string, promptText string, timeoutError string, onStdoutLine func(string)) (stdout string, stderr string, code *int, err error) {
+// runCommand runs args with promptText on stdin. When onStdoutLine is set,
+// stdout is consumed line by line through it and not retained.
+func runCommand(ctx context.Context, cfg Config, cwd string, args []string, promptText string, timeoutError string, onStdoutLine func(string)) (stdout string, stderr stderrTail, code *int, err error) {
 	commandCtx, cancel := context.WithTimeout(ctx, durationOrDefault(cfg.Timeout))
 	defer cancel()
 
@@ -27,15 +29,15 @@ func runCommand(ctx context.Context, cfg Config, cwd string, args []string, prom
 	}
 
 	var stdoutBuf bytes.Buffer
-	var stderrBuf bytes.Buffer
+	stderrBuf := tailBuffer{limit: maxStderrBytes}
 	cmd.Stderr = &stderrBuf
 
 	stdoutPipe, err := cmd.StdoutPipe()
 	if err != nil {
-		return "", stderrBuf.String(), nil, err
+		return "", stderrBuf.tail(), nil, err
 	}
 	if err = cmd.Start(); err != nil {
-		return "", stderrBuf.String(), nil, err
+		return "", stderrBuf.tail(), nil, err
 	}
 
 	scanDone := make(chan error, 1)
@@ -44,11 +46,12 @@ func runCommand(ctx context.Context, cfg Config, cwd string, args []string, prom
 		scanner.Buffer(make([]byte, 0, 64*1024), 10*1024*1024)
 		for scanner.Scan() {
 			line := scanner.Text()
-			stdoutBuf.WriteString(line)
-			stdoutBuf.WriteByte('\n')
 			if onStdoutLine != nil {
 				onStdoutLine(line)
+				continue
 			}
+			stdoutBuf.WriteString(line)
+			stdoutBuf.WriteByte('\n')
 		}
 		scanDone <- scanner.Err()
 	}()
@@ -60,14 +63,53 @@ func runCommand(ctx context.Context, cfg Config, cwd string, args []string, prom
 		}
 	}
 	if commandCtx.Err() == context.DeadlineExceeded {
-		return stdoutBuf.String(), stderrBuf.String(), nil, errors.New(timeoutError)
+		return stdoutBuf.String(), stderrBuf.tail(), nil, errors.New(timeoutError)
 	}
 
 	if cmd.ProcessState != nil {
 		exitCode := cmd.ProcessState.ExitCode()
 		code = &exitCode
 	}
-	return stdoutBuf.String(), stderrBuf.String(), code, err
+	return stdoutBuf.String(), stderrBuf.tail(), code, err
+}
+
+// maxStderrBytes bounds how much executor stderr is kept; error reports only
+// ever show its last part.
+const maxStderrBytes = 64 << 10
+
+// tailBuffer is an io.Writer that keeps only the last limit bytes written.
+type tailBuffer struct {
+	limit   int
+	data    []byte
+	dropped int
+}
+
+func (b *tailBuffer) Write(p []byte) (int, error) {
+	b.data = append(b.data, p...)
+	// Compact only once twice the limit has built up so trimming stays
+	// amortized O(1) per byte.
+	if len(b.data) > 2*b.limit {
+		cut := len(b.data) - b.limit
+		b.dropped += cut
+		b.data = append(b.data[:0], b.data[cut:]...)
+	}
+	return len(p), nil
+}
+
+// stderrTail is what runCommand kept of a process's stderr: its last bytes
+// and how many earlier bytes were dropped.
+type stderrTail struct {
+	text    string
+	dropped int
+}
+
+func (b *tailBuffer) tail() stderrTail {
+	data, dropped := b.data, b.dropped
+	if len(data) > b.limit {
+		dropped += len(data) - b.limit
+		data = data[len(data)-b.limit:]
+	}
+	return stderrTail{text: string(data), dropped: dropped}
 }
 
 func durationOrDefault(value time.Duration) time.Duration {
@@ -89,15 +131,16 @@ func authCommand(ctx context.Context, args ...string) AuthStatus {
 	return AuthStatus{Authenticated: true}
 }
 
-func resultFromRun(parse func(string, string, int, []string) Result, stdout string, stderr string, code *int, cmd []string, runErr error) Result {
+func resultFromRun(parser lineParser, stderr stderrTail, code *int, cmd []string, runErr error) Result {
 	if runErr != nil && code == nil {
-		return Result{Success: false, Error: runErr.Error(), Stderr: stderr, Command: cmd}
+		return Result{Success: false, Error: runErr.Error(), Stderr: stderr.text, StderrDropped: stderr.dropped, Command: cmd}
 	}
 	exitCode := 0
 	if code != nil {
 		exitCode = *code
 	}
-	result := parse(stdout, stderr, exitCode, cmd)
+	result := parser.finish(stderr.text, exitCode, cmd)
+	result.StderrDropped = stderr.dropped
 	if runErr != nil && result.Error == "" {
 		result.Error = runErr.Error()
 		result.Success = false
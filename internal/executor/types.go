@@ -20,6 +20,9 @@ type Request struct {
 	CWD             string
 	Model           string
 	OnChunk         func(content string, chunkType string)
+	// WantsChunks, when set, reports whether OnChunk currently has a consumer.
+	// Output lines are not decoded for streaming while it returns false.
+	WantsChunks func() bool
 }
 
 type PromptRequest = prompt.Request
@@ -33,8 +36,10 @@ type Result struct {
 	SessionID  string
 	ReturnCode *int
 	Stderr     string
-	Command    []string
-	Logs       string
+	// StderrDropped counts earlier stderr bytes not kept in Stderr.
+	StderrDropped int
+	Command       []string
+	Logs          string
 }
 
 type AuthStatus struct {
@@ -57,6 +62,13 @@ type base struct {
 	cfg Config
 }
 
+func (r Request) chunkSink() func(content string, chunkType string) {
+	if r.WantsChunks != nil && !r.WantsChunks() {
+		return nil
+	}
+	return r.OnChunk
+}
+
 func (b base) cwd(req Request) string {
 	if req.CWD != "" {
 		return req.CWD
@@ -49,77 +49,60 @@ func LoadKnowledge(cwd string) string {
 	return "## Knowledge\n\n" + strings.Join(docs, "\n\n") + "\n\n"
 }
 
-func Build(req Request) string {
-	soul, rules := LoadAgentFiles(req.CWD)
-	knowledge := LoadKnowledge(req.CWD)
-
-	var preamble strings.Builder
-	if soul != "" {
-		fmt.Fprintf(&preamble, "## Agent Identity\n\n%s\n\n", soul)
-	}
-	if rules != "" {
-		fmt.Fprintf(&preamble, "## Agent Rules\n\n%s\n\n", rules)
-	}
-	if knowledge != "" {
-		preamble.WriteString(knowledge)
-	}
-
-	responseInstructions := fmt.Sprintf(`
+// Prompt templates are package constants so each Build only substitutes the
+// per-card values.
+const (
+	responseInstructionsTemplate = `
 ## IMPORTANT: How to Respond
 
 When you complete this task, you MUST post your response as a comment on the card.
 Use the kardbrd CLI via the Bash tool:
-`+"```"+`
+` + "```" + `
 kardbrd comment add %s "Your response here"
-`+"```"+`
+` + "```" + `
 
 For multi-line or markdown responses, use a heredoc:
-`+"```"+`
+` + "```" + `
 kardbrd comment add %s "$(cat <<'EOF'
 Your markdown response here.
 
 @%s
 EOF
 )"
-`+"```"+`
+` + "```" + `
 
 End your comment by mentioning the requester: @%s
 
 DO NOT just output text - you must use the kardbrd CLI to post your response.
-`, req.CardID, req.CardID, req.AuthorName, req.AuthorName)
+`
 
-	labelInstructions := ""
-	cliInstructions := ""
-	if req.BoardID != "" {
-		labelInstructions = fmt.Sprintf(`
+	labelInstructionsTemplate = `
 ## Labels
 
 Cards may have labels (shown as "Labels: ..." in card markdown).
 Available CLI commands:
-- `+"`"+`kardbrd board labels %s`+"`"+` to discover available labels
-- `+"`"+`kardbrd card update %s --label-ids ID1 --label-ids ID2`+"`"+` to replace labels
-- `+"`"+`kardbrd card update %s --clear-labels`+"`"+` to remove every label
+- ` + "`" + `kardbrd board labels %s` + "`" + ` to discover available labels
+- ` + "`" + `kardbrd card update %s --label-ids ID1 --label-ids ID2` + "`" + ` to replace labels
+- ` + "`" + `kardbrd card update %s --clear-labels` + "`" + ` to remove every label
 
-**Important:** `+"`"+`--label`+"`"+` and `+"`"+`--label-ids`+"`"+` are repeatable aliases for the complete desired label set. Include labels you want to keep; `+"`"+`--clear-labels`+"`"+` cannot be combined with either alias.
-`, req.BoardID, req.CardID, req.CardID)
+**Important:** ` + "`" + `--label` + "`" + ` and ` + "`" + `--label-ids` + "`" + ` are repeatable aliases for the complete desired label set. Include labels you want to keep; ` + "`" + `--clear-labels` + "`" + ` cannot be combined with either alias.
+`
 
-		cliInstructions = fmt.Sprintf(`
+	cliInstructionsTemplate = `
 ## kardbrd CLI Reference
 
-The `+"`"+`kardbrd`+"`"+` CLI is available for board operations. Key commands:
-- `+"`"+`kardbrd md card %s`+"`"+` - get this card as markdown
-- `+"`"+`kardbrd md board %s`+"`"+` - get board as markdown
-- `+"`"+`kardbrd comment add %s "message"`+"`"+` - add comment to this card
-- `+"`"+`kardbrd card update %s --title "..." --description "..."`+"`"+` - update card
-- `+"`"+`kardbrd card create --board %s --list LIST_ID --title "..."`+"`"+` - create card
-- `+"`"+`kardbrd card move %s --list LIST_ID`+"`"+` - move card
+The ` + "`" + `kardbrd` + "`" + ` CLI is available for board operations. Key commands:
+- ` + "`" + `kardbrd md card %s` + "`" + ` - get this card as markdown
+- ` + "`" + `kardbrd md board %s` + "`" + ` - get board as markdown
+- ` + "`" + `kardbrd comment add %s "message"` + "`" + ` - add comment to this card
+- ` + "`" + `kardbrd card update %s --title "..." --description "..."` + "`" + ` - update card
+- ` + "`" + `kardbrd card create --board %s --list LIST_ID --title "..."` + "`" + ` - create card
+- ` + "`" + `kardbrd card move %s --list LIST_ID` + "`" + ` - move card
 
-Environment variables `+"`"+`KARDBRD_TOKEN`+"`"+` and `+"`"+`KARDBRD_API_URL`+"`"+` are pre-configured.
-`, req.CardID, req.BoardID, req.CardID, req.CardID, req.BoardID, req.CardID)
-	}
+Environment variables ` + "`" + `KARDBRD_TOKEN` + "`" + ` and ` + "`" + `KARDBRD_API_URL` + "`" + ` are pre-configured.
+`
 
-	if strings.HasPrefix(req.Command, "/") {
-		return fmt.Sprintf(`%s%s
+	commandPromptTemplate = `%s%s
 
 ---
 
@@ -133,10 +116,9 @@ Environment variables `+"`"+`KARDBRD_TOKEN`+"`"+` and `+"`"+`KARDBRD_API_URL`+"`
 
 %s
 %s%s%s
-`, preamble.String(), req.Command, req.CardID, req.AuthorName, req.CommentContent, req.CardMarkdown, labelInstructions, cliInstructions, responseInstructions)
-	}
+`
 
-	return fmt.Sprintf(`%s## Task Request
+	taskPromptTemplate = `%s## Task Request
 
 %s
 
@@ -154,7 +136,38 @@ Environment variables `+"`"+`KARDBRD_TOKEN`+"`"+` and `+"`"+`KARDBRD_API_URL`+"`
 
 Please complete this request.
 %s
-`, preamble.String(), req.CommentContent, req.CardID, req.CardMarkdown, labelInstructions, cliInstructions, req.AuthorName, responseInstructions)
+`
+)
+
+func Build(req Request) string {
+	soul, rules := LoadAgentFiles(req.CWD)
+	knowledge := LoadKnowledge(req.CWD)
+
+	var preamble strings.Builder
+	if soul != "" {
+		fmt.Fprintf(&preamble, "## Agent Identity\n\n%s\n\n", soul)
+	}
+	if rules != "" {
+		fmt.Fprintf(&preamble, "## Agent Rules\n\n%s\n\n", rules)
+	}
+	if knowledge != "" {
+		preamble.WriteString(knowledge)
+	}
+
+	responseInstructions := fmt.Sprintf(responseInstructionsTemplate, req.CardID, req.CardID, req.AuthorName, req.AuthorName)
+
+	labelInstructions := ""
+	cliInstructions := ""
+	if req.BoardID != "" {
+		labelInstructions = fmt.Sprintf(labelInstructionsTemplate, req.BoardID, req.CardID, req.CardID)
+		cliInstructions = fmt.Sprintf(cliInstructionsTemplate, req.CardID, req.BoardID, req.CardID, req.CardID, req.BoardID, req.CardID)
+	}
+
+	if strings.HasPrefix(req.Command, "/") {
+		return fmt.Sprintf(commandPromptTemplate, preamble.String(), req.Command, req.CardID, req.AuthorName, req.CommentContent, req.CardMarkdown, labelInstructions, cliInstructions, responseInstructions)
+	}
+
+	return fmt.Sprintf(taskPromptTemplate, preamble.String(), req.CommentContent, req.CardID, req.CardMarkdown, labelInstructions, cliInstructions, req.AuthorName, responseInstructions)
 }
 
 func ExtractCommand(commentContent string, mentionKeyword string) string {
@@ -2,66 +2,161 @@ package rules
 
 import "strings"
 
+// NewEngine returns an Engine for rules with the rule-side work Match would
+// otherwise repeat on every event done once up front: rules are indexed by
+// event type and content_contains is lowercased.
+func NewEngine(rules []Rule) *Engine {
+	needles := make([]string, len(rules))
+	byEvent := map[string][]int{}
+	for i, rule := range rules {
+		needles[i] = stringsLower(rule.ContentContains)
+		for _, eventType := range rule.Events {
+			indexes := byEvent[eventType]
+			if len(indexes) > 0 && indexes[len(indexes)-1] == i {
+				continue
+			}
+			byEvent[eventType] = append(indexes, i)
+		}
+	}
+	return &Engine{Rules: rules, contentNeedles: needles, byEvent: byEvent}
+}
+
 func (e Engine) Match(eventType string, message map[string]any) []Rule {
 	var matched []Rule
-	for _, rule := range e.Rules {
-		if matches(rule, eventType, message) {
-			matched = append(matched, rule)
+	if e.byEvent != nil {
+		candidates := e.byEvent[eventType]
+		if len(candidates) == 0 {
+			return nil
+		}
+		event := newEventFields(message)
+		for _, i := range candidates {
+			if rule := &e.Rules[i]; matches(rule, e.contentNeedles[i], event) {
+				matched = append(matched, *rule)
+			}
+		}
+		return matched
+	}
+
+	event := newEventFields(message)
+	for i := range e.Rules {
+		rule := &e.Rules[i]
+		if containsString(rule.Events, eventType) && matches(rule, stringsLower(rule.ContentContains), event) {
+			matched = append(matched, *rule)
 		}
 	}
 	return matched
 }
 
-func matches(rule Rule, eventType string, message map[string]any) bool {
-	if !containsString(rule.Events, eventType) {
-		return false
+// eventFields holds the message values rules are checked against, read once
+// per Match instead of once per rule.
+type eventFields struct {
+	message            map[string]any
+	listName           string
+	cardTitle          string
+	labelName          string
+	content            string
+	contentLower       string
+	contentLowered     bool
+	labels             []string
+	labelsRead         bool
+	emoji              string
+	userID             string
+	assigneeID         string
+	assigneeIsBot      bool
+	commentAuthorID    string
+	commentAuthorIsBot bool
+}
+
+func newEventFields(message map[string]any) *eventFields {
+	return &eventFields{
+		message:            message,
+		listName:           stringField(message, "list_name"),
+		cardTitle:          stringField(message, "card_title"),
+		labelName:          stringField(message, "label_name"),
+		content:            stringField(message, "content"),
+		emoji:              stringField(message, "emoji"),
+		userID:             stringField(message, "user_id"),
+		assigneeID:         stringField(message, "card_assignee_id"),
+		assigneeIsBot:      boolField(message, "card_assignee_is_bot"),
+		commentAuthorID:    stringField(message, "comment_author_id"),
+		commentAuthorIsBot: boolField(message, "comment_author_is_bot"),
+	}
+}
+
+// lowerContent lowercases the comment content on first use only.
+func (f *eventFields) lowerContent() string {
+	if !f.contentLowered {
+		f.contentLower = stringsLower(f.content)
+		f.contentLowered = true
 	}
-	if rule.List != "" && !equalFold(stringField(message, "list_name"), rule.List) {
+	return f.contentLower
+}
+
+// cardLabels decodes card_labels on first use only, since most rules do not
+// check labels.
+func (f *eventFields) cardLabels() []string {
+	if !f.labelsRead {
+		f.labels = stringSliceField(f.message, "card_labels")
+		f.labelsRead = true
+	}
+	return f.labels
+}
+
+// matches reports whether the event satisfies rule's conditions; the event
+// type is checked by the caller. contentNeedle is rule.ContentContains
+// lowercased.
+func matches(rule *Rule, contentNeedle string, event *eventFields) bool {
+	if rule.List != "" && !equalFold(event.listName, rule.List) {
 		return false
 	}
-	if rule.Title != "" && !equalFold(stringField(message, "card_title"), rule.Title) {
+	if rule.Title != "" && !equalFold(event.cardTitle, rule.Title) {
 		return false
 	}
-	if rule.Label != "" && !equalFold(stringField(message, "label_name"), rule.Label) {
+	if rule.Label != "" && !equalFold(event.labelName, rule.Label) {
 		return false
 	}
-	if rule.ContentContains != "" && !strings.Contains(stringsLower(stringField(message, "content")), stringsLower(rule.ContentContains)) {
+	if contentNeedle != "" && !containsLower(event, contentNeedle) {
 		return false
 	}
-	labels := stringSliceField(message, "card_labels")
-	if rule.ExcludeLabel != "" && containsFold(labels, rule.ExcludeLabel) {
+	if rule.ExcludeLabel != "" && containsFold(event.cardLabels(), rule.ExcludeLabel) {
 		return false
 	}
-	if rule.RequireLabel != "" && !containsFold(labels, rule.RequireLabel) {
+	if rule.RequireLabel != "" && !containsFold(event.cardLabels(), rule.RequireLabel) {
 		return false
 	}
-	if rule.Emoji != "" && stringField(message, "emoji") != rule.Emoji {
+	if rule.Emoji != "" && event.emoji != rule.Emoji {
 		return false
 	}
-	if rule.RequireUser != "" && stringField(message, "user_id") != rule.RequireUser {
+	if rule.RequireUser != "" && event.userID != rule.RequireUser {
 		return false
 	}
 	if len(rule.Assignee) > 0 {
 		if containsString(rule.Assignee, "__self__") {
-			if boolField(message, "card_assignee_is_bot") != true {
+			if !event.assigneeIsBot {
 				return false
 			}
-		} else if !containsString(rule.Assignee, stringField(message, "card_assignee_id")) {
+		} else if !containsString(rule.Assignee, event.assigneeID) {
 			return false
 		}
 	}
 	if rule.CommentAuthor != "" {
 		if rule.CommentAuthor == "__self__" {
-			if boolField(message, "comment_author_is_bot") != true {
+			if !event.commentAuthorIsBot {
 				return false
 			}
-		} else if stringField(message, "comment_author_id") != rule.CommentAuthor {
+		} else if event.commentAuthorID != rule.CommentAuthor {
 			return false
 		}
 	}
 	return true
 }
 
+// containsLower reports whether the event content contains the lowercase
+// needle, ignoring case. A verbatim hit skips lowercasing the content.
+func containsLower(event *eventFields, needle string) bool {
+	return strings.Contains(event.content, needle) || strings.Contains(event.lowerContent(), needle)
+}
+
 func containsString(values []string, needle string) bool {
 	for _, value := range values {
 		if value == needle {
@@ -47,3 +47,26 @@ func TestEngineRejectsNonMatchingConditions(t *testing.T) {
 	labelMatches := engine.Match("card_created", map[string]any{"card_labels": []string{"Blocked"}})
 	assertEqual(t, 0, len(labelMatches))
 }
+
+func TestNewEngineMatchesContentCaseInsensitively(t *testing.T) {
+	engine := NewEngine([]Rule{
+		{Name: "Deploy", Events: []string{"comment_created"}, ContentContains: "Ship It", Action: "/deploy"},
+	})
+
+	assertEqual(t, 1, len(engine.Match("comment_created", map[string]any{"content": "please SHIP IT now"})))
+	assertEqual(t, 0, len(engine.Match("comment_created", map[string]any{"content": "hold"})))
+}
+
+func TestNewEngineDispatchesByEventInRuleOrder(t *testing.T) {
+	engine := NewEngine([]Rule{
+		{Name: "First", Events: []string{"card_created", "card_moved", "card_created"}, Action: "/a"},
+		{Name: "Other", Events: []string{"comment_created"}, Action: "/b"},
+		{Name: "Second", Events: []string{"card_created"}, Action: "/c"},
+	})
+
+	matches := engine.Match("card_created", map[string]any{})
+	assertEqual(t, 2, len(matches))
+	assertEqual(t, "First", matches[0].Name)
+	assertEqual(t, "Second", matches[1].Name)
+	assertEqual(t, 0, len(engine.Match("reaction_added", map[string]any{})))
+}
@@ -69,4 +69,9 @@ func (s Schedule) ModelID() string {
 
 type Engine struct {
 	Rules []Rule
+
+	// Precomputed by NewEngine. An Engine built as a literal still matches,
+	// just without these shortcuts.
+	contentNeedles []string
+	byEvent        map[string][]int
 }
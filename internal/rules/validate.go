@@ -71,10 +71,8 @@ func ValidateFile(path string) ValidationResult {
 	}
 
 	top := mapping(doc)
-	for key := range top {
-		if !knownTopFields[key] {
-			result.addWarning("unknown top-level field '" + key + "'")
-		}
+	for _, key := range unknownKeys(doc, knownTopFields) {
+		result.addWarning("unknown top-level field '" + key + "'")
 	}
 	if scalar(top["board_id"]) == "" {
 		result.addError("Missing required field 'board_id'")
@@ -104,10 +102,8 @@ func validateRulesNode(result *ValidationResult, node *yaml.Node) {
 		}
 		fields := mapping(entry)
 		name := scalar(fields["name"])
-		for key := range fields {
-			if !knownRuleFields[key] {
-				result.addRuleWarning(i, name, "unknown field '"+key+"'")
-			}
+		for _, key := range unknownKeys(entry, knownRuleFields) {
+			result.addRuleWarning(i, name, "unknown field '"+key+"'")
 		}
 		if name == "" {
 			result.addRuleError(i, name, "Missing required field 'name'")
@@ -142,10 +138,8 @@ func validateSchedulesNode(result *ValidationResult, node *yaml.Node) {
 		}
 		fields := mapping(entry)
 		name := scalar(fields["name"])
-		for key := range fields {
-			if !knownScheduleFields[key] {
-				result.addRuleWarning(i, name, "unknown schedule field '"+key+"'")
-			}
+		for _, key := range unknownKeys(entry, knownScheduleFields) {
+			result.addRuleWarning(i, name, "unknown schedule field '"+key+"'")
 		}
 		if name == "" {
 			result.addRuleError(i, name, "Schedule missing required field 'name'")
@@ -181,15 +175,16 @@ func parseEventNode(node *yaml.Node) []string {
 	return nil
 }
 
+// CronParser parses the five-field cron expressions (plus descriptors such as
+// @daily) accepted in kardbrd.yml schedules. The scheduler uses the same
+// parser so anything that validates here can be installed.
+var CronParser = cron.NewParser(cron.Minute | cron.Hour | cron.Dom | cron.Month | cron.Dow | cron.Descriptor)
+
 func validCron(expr string) bool {
-	_, err := standardCronParser().Parse(expr)
+	_, err := CronParser.Parse(expr)
 	return err == nil
 }
 
-func standardCronParser() cron.Parser {
-	return cron.NewParser(cron.Minute | cron.Hour | cron.Dom | cron.Month | cron.Dow | cron.Descriptor)
-}
-
 func mapping(node *yaml.Node) map[string]*yaml.Node {
 	out := make(map[string]*yaml.Node)
 	for i := 0; i+1 < len(node.Content); i += 2 {
@@ -198,6 +193,26 @@ func mapping(node *yaml.Node) map[string]*yaml.Node {
 	return out
 }
 
+// unknownKeys returns the distinct keys of a mapping node that are not in
+// known, in file order. It returns nil without allocating when every key is
+// known.
+func unknownKeys(node *yaml.Node, known map[string]bool) []string {
+	var unknown []string
+	var seen map[string]bool
+	for i := 0; i+1 < len(node.Content); i += 2 {
+		key := node.Content[i].Value
+		if known[key] || seen[key] {
+			continue
+		}
+		if seen == nil {
+			seen = map[string]bool{}
+		}
+		seen[key] = true
+		unknown = append(unknown, key)
+	}
+	return unknown
+}
+
 func scalar(node *yaml.Node) string {
 	if node == nil || node.Kind != yaml.ScalarNode {
 		return ""
@@ -5,6 +5,8 @@ import (
 	"path/filepath"
 	"strings"
 	"testing"
+
+	"gopkg.in/yaml.v3"
 )
 
 func TestValidateRulesFileCollectsErrorsAndWarnings(t *testing.T) {
@@ -87,3 +89,15 @@ func assertIssueContains(t *testing.T, issues []ValidationIssue, text string) {
 	}
 	t.Fatalf("expected issue containing %q, got %#v", text, issues)
 }
+
+func TestUnknownKeysReportsEachKeyOnce(t *testing.T) {
+	node := &yaml.Node{Kind: yaml.MappingNode}
+	for _, key := range []string{"name", "extra", "other", "extra"} {
+		node.Content = append(node.Content, &yaml.Node{Kind: yaml.ScalarNode, Value: key}, &yaml.Node{Kind: yaml.ScalarNode, Value: "v"})
+	}
+
+	unknown := unknownKeys(node, knownRuleFields)
+	assertEqual(t, 2, len(unknown))
+	assertEqual(t, "extra", unknown[0])
+	assertEqual(t, "other", unknown[1])
+}
@@ -5,6 +5,7 @@ import (
 	"encoding/json"
 	"strings"
 	"sync"
+	"time"
 
 	"github.com/Kardbrd/kardbrd-agent/internal/api"
 	"github.com/Kardbrd/kardbrd-agent/internal/rules"
@@ -17,6 +18,9 @@ type Client interface {
 	UpdateCard(ctx context.Context, cardID string, patch api.CardPatch) (json.RawMessage, error)
 }
 
+// boardCacheTTL is how long a fetched board is reused across schedule fires.
+const boardCacheTTL = 30 * time.Second
+
 type Processor func(ctx context.Context, cardID string, schedule rules.Schedule) error
 
 type Manager struct {
@@ -27,8 +31,17 @@ type Manager struct {
 	parser    cron.Parser
 	cron      *cron.Cron
 	entries   []cron.EntryID
+	parsed    map[string]cron.Schedule
 	ctx       context.Context
 	mu        sync.Mutex
+
+	// boardMu guards the cached board. boardGen is bumped whenever the
+	// cache is dropped so a fetch that raced with a card creation is not
+	// stored.
+	boardMu      sync.Mutex
+	board        *api.BoardLayout
+	boardFetched time.Time
+	boardGen     uint64
 }
 
 func NewManager(schedules []rules.Schedule, boardID string, client Client, processor Processor) *Manager {
@@ -37,12 +50,12 @@ func NewManager(schedules []rules.Schedule, boardID string, client Client, proce
 		BoardID:   boardID,
 		Client:    client,
 		Processor: processor,
-		parser:    standardParser(),
+		parser:    rules.CronParser,
 	}
 }
 
 func ValidateCron(expr string) error {
-	_, err := standardParser().Parse(expr)
+	_, err := rules.CronParser.Parse(expr)
 	return err
 }
 
@@ -91,18 +104,28 @@ func (m *Manager) UpdateSchedules(schedules []rules.Schedule) error {
 }
 
 func (m *Manager) installSchedulesLocked(ctx context.Context) error {
+	// Parsed expressions are kept across reloads, so re-installing an
+	// unchanged kardbrd.yml does not parse its cron specs again. The cache
+	// only holds expressions still in use.
+	parsed := make(map[string]cron.Schedule, len(m.Schedules))
 	for _, schedule := range m.Schedules {
 		schedule := schedule
-		entryID, err := m.cron.AddFunc(schedule.Cron, func() {
+		spec, ok := m.parsed[schedule.Cron]
+		if !ok {
+			var err error
+			if spec, err = m.parser.Parse(schedule.Cron); err != nil {
+				return err
+			}
+		}
+		parsed[schedule.Cron] = spec
+		entryID := m.cron.Schedule(spec, cron.FuncJob(func() {
 			if ctx.Err() == nil {
 				_ = m.Trigger(ctx, schedule)
 			}
-		})
-		if err != nil {
-			return err
-		}
+		}))
 		m.entries = append(m.entries, entryID)
 	}
+	m.parsed = parsed
 	return nil
 }
 
@@ -145,7 +168,8 @@ func (m *Manager) EnsureCard(ctx context.Context, schedule rules.Schedule) (stri
 	if err != nil {
 		return "", err
 	}
-	cardID := cardIDFromRaw(raw)
+	m.forgetBoard()
+	cardID := api.ResourceID(raw)
 	if schedule.Assignee != "" && cardID != "" {
 		assignee := schedule.Assignee
 		_, err = m.Client.UpdateCard(ctx, cardID, api.CardPatch{AssigneeID: &assignee, AssigneeSet: true})
@@ -156,43 +180,47 @@ func (m *Manager) EnsureCard(ctx context.Context, schedule rules.Schedule) (stri
 	return cardID, nil
 }
 
-func (m *Manager) loadBoard(ctx context.Context) (boardData, error) {
-	raw, err := m.Client.GetBoard(ctx, m.BoardID, true)
+func (m *Manager) loadBoard(ctx context.Context) (*api.BoardLayout, error) {
+	m.boardMu.Lock()
+	if m.board != nil && time.Since(m.boardFetched) < boardCacheTTL {
+		board := m.board
+		m.boardMu.Unlock()
+		return board, nil
+	}
+	gen := m.boardGen
+	m.boardMu.Unlock()
+
+	board, err := m.fetchBoard(ctx)
 	if err != nil {
-		return boardData{}, err
+		return nil, err
 	}
-	var board boardData
-	if err := json.Unmarshal(raw, &board); err != nil {
-		return boardData{}, err
+	m.boardMu.Lock()
+	if m.boardGen == gen {
+		m.board = board
+		m.boardFetched = time.Now()
 	}
+	m.boardMu.Unlock()
 	return board, nil
 }
 
-type boardData struct {
-	Lists []boardList `json:"lists"`
+// forgetBoard drops the cached board after the manager changes it.
+func (m *Manager) forgetBoard() {
+	m.boardMu.Lock()
+	m.board = nil
+	m.boardGen++
+	m.boardMu.Unlock()
 }
 
-type boardList struct {
-	ID    string      `json:"id"`
-	Name  string      `json:"name"`
-	Cards []boardCard `json:"cards"`
-}
-
-type boardCard struct {
-	ID    string `json:"id"`
-	Title string `json:"title"`
-}
-
-func cardIDFromRaw(raw json.RawMessage) string {
-	var payload struct {
-		ID string `json:"id"`
+func (m *Manager) fetchBoard(ctx context.Context) (*api.BoardLayout, error) {
+	raw, err := m.Client.GetBoard(ctx, m.BoardID, true)
+	if err != nil {
+		return nil, err
 	}
-	_ = json.Unmarshal(raw, &payload)
-	return payload.ID
-}
-
-func standardParser() cron.Parser {
-	return cron.NewParser(cron.Minute | cron.Hour | cron.Dom | cron.Month | cron.Dow | cron.Descriptor)
+	var board api.BoardLayout
+	if err := json.Unmarshal(raw, &board); err != nil {
+		return nil, err
+	}
+	return &board, nil
 }
 
 func scheduleDescription(schedule rules.Schedule) string {
@@ -39,6 +39,22 @@ func TestEnsureScheduleCardFindsExistingByTitle(t *testing.T) {
 	assertEqual(t, "", client.createdListID)
 }
 
+func TestEnsureScheduleCardPrefersFirstCardWithTitle(t *testing.T) {
+	client := &fakeScheduleClient{board: rawScheduleJSON(t, map[string]any{
+		"lists": []any{
+			map[string]any{"id": "list1", "cards": []any{map[string]any{"id": "card1", "title": "Weekly"}}},
+			map[string]any{"id": "list2", "cards": []any{map[string]any{"id": "card2", "title": "WEEKLY"}}},
+		},
+	})}
+	manager := NewManager([]rules.Schedule{}, "board1", client, nil)
+
+	cardID, err := manager.EnsureCard(context.Background(), rules.Schedule{Name: "weekly"})
+	if err != nil {
+		t.Fatal(err)
+	}
+	assertEqual(t, "card1", cardID)
+}
+
 func TestEnsureScheduleCardCreatesInNamedListAndAssigns(t *testing.T) {
 	client := &fakeScheduleClient{board: rawScheduleJSON(t, map[string]any{
 		"lists": []any{
@@ -62,6 +78,31 @@ func TestEnsureScheduleCardCreatesInNamedListAndAssigns(t *testing.T) {
 	assertEqual(t, "user1", client.assigneeID)
 }
 
+func TestEnsureScheduleCardReusesBoardUntilCardCreated(t *testing.T) {
+	client := &fakeScheduleClient{board: rawScheduleJSON(t, map[string]any{
+		"lists": []any{
+			map[string]any{"id": "todo", "cards": []any{map[string]any{"id": "card1", "title": "Daily"}}},
+		},
+	})}
+	manager := NewManager([]rules.Schedule{}, "board1", client, nil)
+	ctx := context.Background()
+
+	for i := 0; i < 2; i++ {
+		if _, err := manager.EnsureCard(ctx, rules.Schedule{Name: "Daily"}); err != nil {
+			t.Fatal(err)
+		}
+	}
+	assertEqual(t, 1, client.boardFetches)
+
+	if _, err := manager.EnsureCard(ctx, rules.Schedule{Name: "Weekly"}); err != nil {
+		t.Fatal(err)
+	}
+	if _, err := manager.EnsureCard(ctx, rules.Schedule{Name: "Daily"}); err != nil {
+		t.Fatal(err)
+	}
+	assertEqual(t, 2, client.boardFetches)
+}
+
 func TestTriggerEnsuresCardAndRunsProcessor(t *testing.T) {
 	client := &fakeScheduleClient{board: rawScheduleJSON(t, map[string]any{
 		"lists": []any{map[string]any{"id": "todo", "name": "Todo", "cards": []any{}}},
@@ -95,12 +136,14 @@ func TestUpdateSchedulesReplacesConfiguredSchedules(t *testing.T) {
 
 type fakeScheduleClient struct {
 	board         json.RawMessage
+	boardFetches  int
 	createdListID string
 	createdTitle  string
 	assigneeID    string
 }
 
 func (c *fakeScheduleClient) GetBoard(ctx context.Context, boardID string, includeArchived bool) (json.RawMessage, error) {
+	c.boardFetches++
 	return c.board, nil
 }
 
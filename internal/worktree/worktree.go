@@ -2,12 +2,14 @@ package worktree
 
 import (
 	"bytes"
+	"context"
 	"errors"
 	"fmt"
 	"os"
 	"os/exec"
 	"path/filepath"
 	"strings"
+	"sync"
 )
 
 type RunResult struct {
@@ -25,8 +27,19 @@ type Manager struct {
 	SetupCommand  string
 	ExecutorType  string
 	Runner        Runner
-
-	active map[string]string
+	// PoolSize is the number of pre-created worktrees kept ready so a card
+	// can skip `git worktree add` and the setup command. Zero disables it.
+	PoolSize int
+
+	active  map[string]string
+	warm    []string
+	warmSeq int
+	refill  chan struct{}
+	mu      sync.Mutex
+	// gitMu serializes git commands that write the base repo's .git
+	// (worktree add/remove, main updates) so they never race on its
+	// lock files.
+	gitMu sync.Mutex
 }
 
 func NewManager(baseRepo string, worktreesDir string, setupCommand string, executorType string) *Manager {
@@ -46,11 +59,24 @@ func NewManager(baseRepo string, worktreesDir string, setupCommand string, execu
 		ExecutorType:  executorType,
 		Runner:        commandRunner{},
 		active:        map[string]string{},
+		refill:        make(chan struct{}, 1),
 	}
 }
 
+// WorktreePath returns where a card's worktree lives. A card that claimed a
+// warm worktree keeps it at its warm-<n> path, recorded by a card-<id>
+// symlink, because moving it would break absolute paths the setup command
+// wrote there.
 func (m *Manager) WorktreePath(cardID string) string {
-	return filepath.Clean(filepath.Join(m.WorktreesBase, "card-"+shortID(cardID)))
+	link := m.cardLink(cardID)
+	if target, err := os.Readlink(link); err == nil {
+		return target
+	}
+	return link
+}
+
+func (m *Manager) cardLink(cardID string) string {
+	return filepath.Join(m.WorktreesBase, "card-"+shortID(cardID))
 }
 
 func (m *Manager) BranchName(cardID string) string {
@@ -64,24 +90,37 @@ func (m *Manager) Create(cardID string, branchName string) (string, error) {
 	path := m.WorktreePath(cardID)
 
 	if exists(path) {
-		m.active[cardID] = path
+		m.setActive(cardID, path)
 		return path, nil
 	}
+	if link := m.cardLink(cardID); path != link {
+		// The claimed warm worktree is gone; drop its stale record.
+		_ = os.Remove(link)
+		path = link
+	}
 	if err := os.MkdirAll(m.WorktreesBase, 0o755); err != nil {
 		return "", fmt.Errorf("create worktrees directory: %w", err)
 	}
 
-	_ = m.updateMainBranch()
+	if warm, ok := m.createFromWarm(cardID, branchName); ok {
+		m.setActive(cardID, warm)
+		return warm, nil
+	}
 
+	m.gitMu.Lock()
+	_ = m.updateMainBranch()
 	_, err := m.run("git", "worktree", "add", "-b", branchName, path)
 	if err != nil {
 		if !strings.Contains(strings.ToLower(err.Error()), "already exists") {
+			m.gitMu.Unlock()
 			return "", fmt.Errorf("failed to create worktree: %w", err)
 		}
 		if _, fallbackErr := m.run("git", "worktree", "add", path, branchName); fallbackErr != nil {
+			m.gitMu.Unlock()
 			return "", fmt.Errorf("failed to create worktree: %w", fallbackErr)
 		}
 	}
+	m.gitMu.Unlock()
 
 	if err := m.SetupSymlinks(path); err != nil {
 		return "", err
@@ -90,15 +129,167 @@ func (m *Manager) Create(cardID string, branchName string) (string, error) {
 		return "", err
 	}
 
-	m.active[cardID] = path
+	m.setActive(cardID, path)
 	return path, nil
 }
 
+// RunPool keeps the warm pool filled until ctx is cancelled. Create signals it
+// whenever a warm worktree is handed out. Refill failures are passed to
+// onError, if set. Unclaimed warm worktrees are pruned on start and on exit.
+func (m *Manager) RunPool(ctx context.Context, onError func(error)) {
+	m.PruneWarm()
+	defer m.PruneWarm()
+	for {
+		if err := m.Refill(); err != nil && onError != nil {
+			onError(err)
+		}
+		select {
+		case <-ctx.Done():
+			return
+		case <-m.refill:
+		}
+	}
+}
+
+// PruneWarm removes warm worktrees that no card has claimed, including ones
+// left behind by a previous run, and empties the pool.
+func (m *Manager) PruneWarm() {
+	m.mu.Lock()
+	m.warm = nil
+	claimed := map[string]bool{}
+	links, _ := filepath.Glob(filepath.Join(m.WorktreesBase, "card-*"))
+	for _, link := range links {
+		if target, err := os.Readlink(link); err == nil {
+			claimed[target] = true
+		}
+	}
+	m.mu.Unlock()
+
+	paths, _ := filepath.Glob(filepath.Join(m.WorktreesBase, "warm-*"))
+	for _, path := range paths {
+		if !claimed[path] {
+			m.discardWarm(path)
+		}
+	}
+}
+
+// Refill creates detached worktrees at the base repo's HEAD until the pool
+// holds PoolSize entries. Existing warm-<n> paths belong to cards or are
+// pruned, so they are skipped.
+func (m *Manager) Refill() error {
+	updated := false
+	for {
+		m.mu.Lock()
+		if len(m.warm) >= m.PoolSize {
+			m.mu.Unlock()
+			return nil
+		}
+		m.warmSeq++
+		path := filepath.Join(m.WorktreesBase, fmt.Sprintf("warm-%d", m.warmSeq))
+		m.mu.Unlock()
+
+		if exists(path) {
+			continue
+		}
+		if err := os.MkdirAll(m.WorktreesBase, 0o755); err != nil {
+			return fmt.Errorf("create worktrees directory: %w", err)
+		}
+
+		m.gitMu.Lock()
+		if !updated {
+			_ = m.updateMainBranch()
+			updated = true
+		}
+		_, err := m.run("git", "worktree", "add", "--detach", path)
+		m.gitMu.Unlock()
+		if err != nil {
+			return fmt.Errorf("failed to create warm worktree: %w", err)
+		}
+		if err := m.SetupSymlinks(path); err != nil {
+			m.discardWarm(path)
+			return err
+		}
+		if err := m.runSetupCommand(path); err != nil {
+			m.discardWarm(path)
+			return err
+		}
+		m.addWarm(path)
+	}
+}
+
+// createFromWarm claims a warm worktree for cardID in place and checks out
+// branchName at the base repo's HEAD, the same start point a cold
+// `git worktree add -b` uses.
+func (m *Manager) createFromWarm(cardID string, branchName string) (string, bool) {
+	link := m.cardLink(cardID)
+	m.mu.Lock()
+	if len(m.warm) == 0 {
+		m.mu.Unlock()
+		return "", false
+	}
+	warm := m.warm[len(m.warm)-1]
+	m.warm = m.warm[:len(m.warm)-1]
+	// Record the claim while still holding mu so PruneWarm never sees the
+	// worktree as both out of the pool and unclaimed.
+	if err := os.Symlink(warm, link); err != nil {
+		m.warm = append(m.warm, warm)
+		m.mu.Unlock()
+		return "", false
+	}
+	m.mu.Unlock()
+
+	select {
+	case m.refill <- struct{}{}:
+	default:
+	}
+
+	m.gitMu.Lock()
+	defer m.gitMu.Unlock()
+	_ = m.updateMainBranch()
+	head, err := m.run("git", "rev-parse", "HEAD")
+	if err == nil {
+		_, err = m.Runner.Run(warm, []string{"git", "checkout", "-b", branchName, strings.TrimSpace(head.Stdout)})
+		if err != nil && strings.Contains(strings.ToLower(err.Error()), "already exists") {
+			_, err = m.Runner.Run(warm, []string{"git", "checkout", branchName})
+		}
+	}
+	if err != nil {
+		_, _ = m.run("git", "worktree", "remove", "--force", warm)
+		_ = os.Remove(link)
+		return "", false
+	}
+	return warm, true
+}
+
+func (m *Manager) discardWarm(path string) {
+	m.gitMu.Lock()
+	defer m.gitMu.Unlock()
+	_, _ = m.run("git", "worktree", "remove", "--force", path)
+}
+
+func (m *Manager) addWarm(path string) {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+	m.warm = append(m.warm, path)
+}
+
+func (m *Manager) setActive(cardID string, path string) {
+	m.mu.Lock()
+	defer m.mu.Unlock()
+	m.active[cardID] = path
+}
+
 func (m *Manager) Remove(cardID string, force bool) error {
 	path := m.WorktreePath(cardID)
+	m.mu.Lock()
 	delete(m.active, cardID)
+	m.mu.Unlock()
 
+	link := m.cardLink(cardID)
 	if !exists(path) {
+		if path != link {
+			_ = os.Remove(link)
+		}
 		return nil
 	}
 
@@ -106,9 +297,14 @@ func (m *Manager) Remove(cardID string, force bool) error {
 	if force {
 		args = append(args, "--force")
 	}
+	m.gitMu.Lock()
+	defer m.gitMu.Unlock()
 	if _, err := m.run(args...); err != nil {
 		return fmt.Errorf("failed to remove worktree: %w", err)
 	}
+	if path != link {
+		_ = os.Remove(link)
+	}
 	return nil
 }
 
@@ -118,9 +314,11 @@ func (m *Manager) Get(cardID string) (string, bool) {
 }
 
 func (m *Manager) ListActive() []string {
+	m.mu.Lock()
+	defer m.mu.Unlock()
 	var paths []string
 	for _, path := range m.active {
-		if exists(path) && exists(filepath.Join(path, ".git")) {
+		if exists(filepath.Join(path, ".git")) {
 			paths = append(paths, path)
 		}
 	}
@@ -151,27 +349,36 @@ func (m *Manager) SetupSymlinks(worktreePath string) error {
 	}
 }
 
+// updateMainBranch fast-forwards local main to origin/main. When another
+// branch is checked out, fetching into main directly avoids switching the
+// base repo's working tree there and back.
 func (m *Manager) updateMainBranch() error {
-	if _, err := m.run("git", "fetch", "origin", "main"); err != nil {
-		return err
-	}
-	result, err := m.run("git", "rev-parse", "--abbrev-ref", "HEAD")
+	current, err := m.currentBranch()
 	if err != nil {
 		return err
 	}
-	current := strings.TrimSpace(result.Stdout)
-	if _, err := m.run("git", "checkout", "main"); err != nil {
-		return err
-	}
-	if _, err := m.run("git", "pull", "--ff-only"); err != nil {
+	if current == "main" {
+		_, err = m.run("git", "pull", "--ff-only", "origin", "main")
 		return err
 	}
-	if current != "" && current != "main" {
-		if _, err := m.run("git", "checkout", current); err != nil {
-			return err
+	_, err = m.run("git", "fetch", "origin", "main:main")
+	return err
+}
+
+// currentBranch reads the checked-out branch straight from .git/HEAD, only
+// asking git when the repository layout is not the plain one.
+func (m *Manager) currentBranch() (string, error) {
+	head, err := os.ReadFile(filepath.Join(m.BaseRepo, ".git", "HEAD"))
+	if err == nil {
+		if ref, ok := strings.CutPrefix(strings.TrimSpace(string(head)), "ref: refs/heads/"); ok {
+			return ref, nil
 		}
 	}
-	return nil
+	result, err := m.run("git", "rev-parse", "--abbrev-ref", "HEAD")
+	if err != nil {
+		return "", err
+	}
+	return strings.TrimSpace(result.Stdout), nil
 }
 
 func (m *Manager) runSetupCommand(worktreePath string) error {
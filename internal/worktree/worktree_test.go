@@ -1,6 +1,7 @@
 package worktree
 
 import (
+	"context"
 	"os"
 	"path/filepath"
 	"reflect"
@@ -27,11 +28,8 @@ func TestCreateWorktreeCommandOrder(t *testing.T) {
 
 	got := runner.commandsOnly()
 	want := []string{
-		"git fetch origin main",
 		"git rev-parse --abbrev-ref HEAD",
-		"git checkout main",
-		"git pull --ff-only",
-		"git checkout feature",
+		"git fetch origin main:main",
 		"git worktree add -b card/abcdef12 " + manager.WorktreePath("abcdef123456"),
 	}
 	if !reflect.DeepEqual(got, want) {
@@ -39,6 +37,44 @@ func TestCreateWorktreeCommandOrder(t *testing.T) {
 	}
 }
 
+func TestCreateWorktreeReadsBranchFromHeadFile(t *testing.T) {
+	base := t.TempDir()
+	if err := os.MkdirAll(filepath.Join(base, ".git"), 0o755); err != nil {
+		t.Fatal(err)
+	}
+	writeFile(t, filepath.Join(base, ".git", "HEAD"), "ref: refs/heads/feature\n")
+	runner := &fakeRunner{}
+	manager := NewManager(base, t.TempDir(), "", "claude")
+	manager.Runner = runner
+
+	if _, err := manager.Create("abcdef123456", ""); err != nil {
+		t.Fatal(err)
+	}
+
+	got := strings.Join(runner.commandsOnly(), "\n")
+	assertContains(t, got, "git fetch origin main:main")
+	if strings.Contains(got, "rev-parse") {
+		t.Fatalf("expected HEAD to be read without git, got %q", got)
+	}
+}
+
+func TestCreateWorktreePullsWhenOnMain(t *testing.T) {
+	base := t.TempDir()
+	runner := &fakeRunner{stdout: map[string]string{"git rev-parse --abbrev-ref HEAD": "main\n"}}
+	manager := NewManager(base, t.TempDir(), "", "claude")
+	manager.Runner = runner
+
+	if _, err := manager.Create("abcdef123456", ""); err != nil {
+		t.Fatal(err)
+	}
+
+	got := strings.Join(runner.commandsOnly(), "\n")
+	assertContains(t, got, "git rev-parse --abbrev-ref HEAD\ngit pull --ff-only origin main\ngit worktree add")
+	if strings.Contains(got, "git checkout") {
+		t.Fatalf("expected no branch switching, got %q", got)
+	}
+}
+
 func TestCreateWorktreeFallsBackWhenBranchExists(t *testing.T) {
 	base := t.TempDir()
 	runner := &fakeRunner{
@@ -59,6 +95,103 @@ func TestCreateWorktreeFallsBackWhenBranchExists(t *testing.T) {
 	assertContains(t, got, "git worktree add "+filepath.Join(base, "card-abcdef12")+" card/abcdef12")
 }
 
+func TestCreateWorktreeUsesWarmPool(t *testing.T) {
+	base := t.TempDir()
+	worktrees := t.TempDir()
+	runner := &fakeRunner{stdout: map[string]string{
+		"git rev-parse --abbrev-ref HEAD": "feature\n",
+		"git rev-parse HEAD":              "abc123\n",
+	}}
+	manager := NewManager(base, worktrees, "npm install", "claude")
+	manager.Runner = runner
+	manager.PoolSize = 1
+
+	if err := manager.Refill(); err != nil {
+		t.Fatal(err)
+	}
+	warm := filepath.Join(worktrees, "warm-1")
+	assertContains(t, strings.Join(runner.commandsOnly(), "\n"), "git worktree add --detach "+warm+"\nsh -c npm install")
+
+	runner.commands = nil
+	path, err := manager.Create("abcdef123456", "")
+	if err != nil {
+		t.Fatal(err)
+	}
+	assertEqual(t, warm, path)
+	assertEqual(t, warm, manager.WorktreePath("abcdef123456"))
+	assertSymlinkTarget(t, filepath.Join(worktrees, "card-abcdef12"), warm)
+	got := strings.Join(runner.commandsOnly(), "\n")
+	assertContains(t, got, "git rev-parse HEAD\ngit checkout -b card/abcdef12 abc123")
+	if strings.Contains(got, "npm install") || strings.Contains(got, "git worktree add") {
+		t.Fatalf("expected warm worktree to skip creation and setup, got %q", got)
+	}
+}
+
+func TestRunPoolReportsRefillErrors(t *testing.T) {
+	worktrees := t.TempDir()
+	runner := &fakeRunner{errs: map[string]error{
+		"git worktree add --detach " + filepath.Join(worktrees, "warm-1"): RunError{Stderr: "fatal: invalid reference"},
+	}}
+	manager := NewManager(t.TempDir(), worktrees, "npm install", "claude")
+	manager.Runner = runner
+	manager.PoolSize = 1
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	var reported []error
+	manager.RunPool(ctx, func(err error) { reported = append(reported, err) })
+
+	assertEqual(t, 1, len(reported))
+	assertContains(t, reported[0].Error(), "invalid reference")
+}
+
+func TestPruneWarmKeepsClaimedWorktrees(t *testing.T) {
+	worktrees := t.TempDir()
+	claimed := filepath.Join(worktrees, "warm-1")
+	spare := filepath.Join(worktrees, "warm-2")
+	for _, path := range []string{claimed, spare} {
+		if err := os.MkdirAll(path, 0o755); err != nil {
+			t.Fatal(err)
+		}
+	}
+	if err := os.Symlink(claimed, filepath.Join(worktrees, "card-abcdef12")); err != nil {
+		t.Fatal(err)
+	}
+	runner := &fakeRunner{}
+	manager := NewManager(t.TempDir(), worktrees, "npm install", "claude")
+	manager.Runner = runner
+
+	manager.PruneWarm()
+
+	want := []string{"git worktree remove --force " + spare}
+	if got := runner.commandsOnly(); !reflect.DeepEqual(got, want) {
+		t.Fatalf("commands mismatch:\nwant %#v\n got %#v", want, got)
+	}
+}
+
+func TestRemoveClaimedWarmWorktreeDropsRecord(t *testing.T) {
+	worktrees := t.TempDir()
+	warm := filepath.Join(worktrees, "warm-1")
+	if err := os.MkdirAll(warm, 0o755); err != nil {
+		t.Fatal(err)
+	}
+	link := filepath.Join(worktrees, "card-abcdef12")
+	if err := os.Symlink(warm, link); err != nil {
+		t.Fatal(err)
+	}
+	runner := &fakeRunner{}
+	manager := NewManager(t.TempDir(), worktrees, "", "claude")
+	manager.Runner = runner
+
+	if err := manager.Remove("abcdef123456", false); err != nil {
+		t.Fatal(err)
+	}
+	assertContains(t, strings.Join(runner.commandsOnly(), "\n"), "git worktree remove "+warm)
+	if _, err := os.Lstat(link); !os.IsNotExist(err) {
+		t.Fatalf("expected card record to be removed, got %v", err)
+	}
+}
+
 func TestSetupSymlinks(t *testing.T) {
 	base := t.TempDir()
 	worktree := t.TempDir()